@@ -1,23 +1,34 @@
 import requests
 from typing import Optional, Dict, Any
+from api.session import DEFAULT_TIMEOUT, Timeout, session as shared_session
 from api.singleton import SingletonMeta
 
 
 class AdminAPI(metaclass=SingletonMeta):
-    def __init__(self, server_address: str, admin_key: str) -> None:
+    def __init__(
+        self,
+        server_address: str,
+        admin_key: str,
+        session: Optional[requests.Session] = None,
+        timeout: Timeout = DEFAULT_TIMEOUT,
+    ) -> None:
         self.server_address: str = server_address
         self.admin_key: str = admin_key
         self.game_key: Optional[str] = None
+        self.session: requests.Session = session or shared_session
+        self.timeout: Timeout = timeout
 
-    def create_game(self, epochs: int, timestep: int) -> Dict[str, Any]:
+    def create_game(self, epochs: int, timestep: int, seed: Optional[int] = None) -> Dict[str, Any]:
         api_url = f"http://{self.server_address}/create_game"
         payload = {
             "admin_key": self.admin_key,
             "epochs": epochs,
             "timestep": timestep,
         }
+        if seed is not None:
+            payload["seed"] = seed
 
-        response = requests.post(api_url, json=payload)
+        response = self.session.post(api_url, json=payload, timeout=self.timeout)
 
         if response.status_code >= 400:
             raise requests.HTTPError(f"HTTP {response.status_code}: {response.text}")
@@ -32,7 +43,7 @@ class AdminAPI(metaclass=SingletonMeta):
             "game_key": self.game_key,
         }
 
-        response = requests.post(api_url, json=payload)
+        response = self.session.post(api_url, json=payload, timeout=self.timeout)
 
         if response.status_code >= 400:
             raise requests.HTTPError(f"HTTP {response.status_code}: {response.text}")
@@ -45,7 +56,7 @@ class AdminAPI(metaclass=SingletonMeta):
             "admin_key": self.admin_key,
             "game_key": self.game_key,
         }
-        response = requests.post(api_url, json=payload)
+        response = self.session.post(api_url, json=payload, timeout=self.timeout)
 
         if response.status_code >= 400:
             raise requests.HTTPError(f"HTTP {response.status_code}: {response.text}")
@@ -58,7 +69,7 @@ class AdminAPI(metaclass=SingletonMeta):
             "game_key": self.game_key,
             "admin_key": self.admin_key,
         }
-        response = requests.post(api_url, json=payload)
+        response = self.session.post(api_url, json=payload, timeout=self.timeout)
 
         if response.status_code >= 400:
             raise requests.HTTPError(f"HTTP {response.status_code}: {response.text}")
@@ -71,7 +82,7 @@ class AdminAPI(metaclass=SingletonMeta):
             "game_key": self.game_key,
             "admin_key": self.admin_key,
         }
-        response = requests.post(api_url, json=payload)
+        response = self.session.post(api_url, json=payload, timeout=self.timeout)
 
         if response.status_code >= 400:
             raise requests.HTTPError(f"HTTP {response.status_code}: {response.text}")
@@ -0,0 +1,94 @@
+import json
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+import httpx
+
+from api.wire import ACCEPT, decode
+
+
+def make_client(retries: int = 3, pool_size: int = 100, timeout: float = 10.0) -> httpx.AsyncClient:
+    """Pooled keep-alive client; like the sync session, only failed connections are retried."""
+    transport = httpx.AsyncHTTPTransport(
+        retries=retries,
+        limits=httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size),
+    )
+    return httpx.AsyncClient(transport=transport, timeout=httpx.Timeout(timeout, connect=3.05))
+
+
+class AsyncGameAPI:
+    """
+    Asyncio counterpart of GameAPI for bots. It is not a singleton: create one instance per
+    player key and pass them all the same client, so many players share one connection pool
+    on a single event loop.
+    """
+
+    def __init__(
+        self,
+        server_address: str,
+        game_key: str,
+        player_key: Optional[str] = None,
+        client: Optional[httpx.AsyncClient] = None,
+    ) -> None:
+        self.server_address: str = server_address
+        self.game_key: str = game_key
+        self.player_key: Optional[str] = player_key
+        self.client: httpx.AsyncClient = client or make_client()
+
+    async def _post(self, route: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        response = await self.client.post(
+            f"http://{self.server_address}/{route}", json=payload, headers={"Accept": ACCEPT}
+        )
+        response.raise_for_status()
+        decoded = decode(response.content, response.headers.get("Content-Type", ""))
+        return decoded if decoded is not None else response.json()
+
+    async def join_game(self, player_name: str) -> Dict[str, Any]:
+        result = await self._post(
+            "join_game", {"game_key": self.game_key, "player_name": player_name}
+        )
+        self.player_key = result.get("player_key")
+        return result
+
+    async def game_status(self) -> Dict[str, Any]:
+        return await self._post(
+            "game_status", {"game_key": self.game_key, "player_key": self.player_key}
+        )
+
+    async def get_latest_price(self) -> Dict[str, Any]:
+        return await self._post(
+            "get_latest_price", {"game_key": self.game_key, "player_key": self.player_key}
+        )
+
+    async def subscribe_price(self) -> AsyncIterator[Dict[str, Any]]:
+        params = {"game_key": self.game_key, "player_key": self.player_key or ""}
+        url = f"http://{self.server_address}/subscribe_price"
+        # The server sends a keep-alive at least every 15 seconds
+        timeout = httpx.Timeout(30.0, connect=3.05)
+        async with self.client.stream("GET", url, params=params, timeout=timeout) as response:
+            response.raise_for_status()
+            async for line in response.aiter_lines():
+                if line.startswith("event: close"):
+                    return
+                if line.startswith("data: "):
+                    yield json.loads(line[len("data: ") :])
+
+    async def trade(self, position: int) -> Dict[str, Any]:
+        return await self._post(
+            "trade",
+            {"game_key": self.game_key, "player_key": self.player_key, "position": position},
+        )
+
+    async def trade_batch(self, orders: List[Tuple[str, int]]) -> Dict[str, Any]:
+        return await self._post(
+            "trade_batch",
+            {
+                "game_key": self.game_key,
+                "orders": [
+                    {"player_key": player_key, "position": position}
+                    for player_key, position in orders
+                ],
+            },
+        )
+
+    async def get_scoreboard(self, since: int = 0) -> Dict[str, Any]:
+        return await self._post("get_scoreboard", {"game_key": self.game_key, "since_epoch": since})
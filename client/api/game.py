@@ -1,13 +1,24 @@
+import json
 import requests
-from typing import Optional, Dict, Any
-from singleton import SingletonMeta
+from typing import Optional, Dict, Any, Iterator, List, Tuple
+from api.session import DEFAULT_TIMEOUT, STREAM_TIMEOUT, Timeout, session as shared_session
+from api.singleton import SingletonMeta
+from api.wire import ACCEPT, decode
 
 
 class GameAPI(metaclass=SingletonMeta):
-    def __init__(self, server_address: str, game_key: str) -> None:
+    def __init__(
+        self,
+        server_address: str,
+        game_key: str,
+        session: Optional[requests.Session] = None,
+        timeout: Timeout = DEFAULT_TIMEOUT,
+    ) -> None:
         self.server_address: str = server_address
         self.game_key: str = game_key
         self.player_key: Optional[str] = None
+        self.session: requests.Session = session or shared_session
+        self.timeout: Timeout = timeout
 
     def join_game(self, player_name: str) -> Dict[str, Any]:
         api_url = f"http://{self.server_address}/join_game"
@@ -15,7 +26,7 @@ class GameAPI(metaclass=SingletonMeta):
             "game_key": self.game_key,
             "player_name": player_name,
         }
-        response = requests.post(api_url, json=payload)
+        response = self.session.post(api_url, json=payload, timeout=self.timeout)
         response.raise_for_status()
         result = response.json()
         self.player_key = result.get("player_key")
@@ -27,7 +38,7 @@ class GameAPI(metaclass=SingletonMeta):
             "game_key": self.game_key,
             "player_key": self.player_key,
         }
-        response = requests.post(api_url, json=payload)
+        response = self.session.post(api_url, json=payload, timeout=self.timeout)
         response.raise_for_status()
         return response.json()
 
@@ -37,9 +48,27 @@ class GameAPI(metaclass=SingletonMeta):
             "game_key": self.game_key,
             "player_key": self.player_key,
         }
-        response = requests.post(api_url, json=payload)
+        response = self.session.post(
+            api_url, json=payload, headers={"Accept": ACCEPT}, timeout=self.timeout
+        )
         response.raise_for_status()
-        return response.json()
+        return self._decode(response)
+
+    def subscribe_price(self) -> Iterator[Dict[str, Any]]:
+        api_url = f"http://{self.server_address}/subscribe_price"
+        params = {
+            "game_key": self.game_key,
+            "player_key": self.player_key,
+        }
+        with self.session.get(
+            api_url, params=params, stream=True, timeout=STREAM_TIMEOUT
+        ) as response:
+            response.raise_for_status()
+            for line in response.iter_lines(decode_unicode=True):
+                if line.startswith("event: close"):
+                    return
+                if line.startswith("data: "):
+                    yield json.loads(line[len("data: ") :])
 
     def trade(self, position: int) -> Dict[str, Any]:
         api_url = f"http://{self.server_address}/trade"
@@ -48,13 +77,33 @@ class GameAPI(metaclass=SingletonMeta):
             "player_key": self.player_key,
             "position": position,
         }
-        response = requests.post(api_url, json=payload)
+        response = self.session.post(api_url, json=payload, timeout=self.timeout)
         response.raise_for_status()
         return response.json()
 
-    def get_scoreboard(self) -> Dict[str, Any]:
-        api_url = f"http://{self.server_address}/get_scoreboard"
-        payload = {"game_key": self.game_key}
-        response = requests.post(api_url, json=payload)
+    def trade_batch(self, orders: List[Tuple[str, int]]) -> Dict[str, Any]:
+        api_url = f"http://{self.server_address}/trade_batch"
+        payload = {
+            "game_key": self.game_key,
+            "orders": [
+                {"player_key": player_key, "position": position} for player_key, position in orders
+            ],
+        }
+        response = self.session.post(api_url, json=payload, timeout=self.timeout)
         response.raise_for_status()
         return response.json()
+
+    def get_scoreboard(self, since: int = 0) -> Dict[str, Any]:
+        api_url = f"http://{self.server_address}/get_scoreboard"
+        payload = {"game_key": self.game_key, "since_epoch": since}
+        response = self.session.post(
+            api_url, json=payload, headers={"Accept": ACCEPT}, timeout=self.timeout
+        )
+        response.raise_for_status()
+        return self._decode(response)
+
+    @staticmethod
+    def _decode(response: requests.Response) -> Dict[str, Any]:
+        """Decode a MessagePack or JSON body into the same dictionary."""
+        decoded = decode(response.content, response.headers.get("Content-Type", ""))
+        return decoded if decoded is not None else response.json()
@@ -0,0 +1,41 @@
+from typing import Tuple, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# (connect, read) timeouts in seconds
+Timeout = Union[float, Tuple[float, float]]
+DEFAULT_TIMEOUT: Timeout = (3.05, 10.0)
+# The server sends an event-stream keep-alive at least every 15 seconds
+STREAM_TIMEOUT: Timeout = (3.05, 30.0)
+
+
+def make_session(retries: int = 3, backoff: float = 0.2, pool_size: int = 10) -> requests.Session:
+    """
+    Create a keep-alive session with a connection pool. Failed connections are retried with
+    exponential backoff, as nothing reached the server. A request that did reach it is never
+    resent after a read timeout, and only idempotent methods are resent after a 502/503/504:
+    a proxy can time out after the server has already applied a POSTed order, and resending
+    it would place the order twice.
+    """
+    retry = Retry(
+        total=retries,
+        connect=retries,
+        read=0,
+        status=retries,
+        backoff_factor=backoff,
+        status_forcelist=(502, 503, 504),
+        allowed_methods=Retry.DEFAULT_ALLOWED_METHODS,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+# Shared by AdminAPI and GameAPI so both reuse the same pooled connections
+session: requests.Session = make_session()
@@ -0,0 +1,28 @@
+from typing import Any
+
+import numpy as np
+
+try:
+    import msgpack
+except ImportError:  # Fall back to JSON responses
+    msgpack = None
+
+MSGPACK = "application/msgpack"
+
+# Sent on the endpoints that can answer in MessagePack
+ACCEPT = f"{MSGPACK}, application/json;q=0.9" if msgpack else "application/json"
+
+
+def _expand(value: Any) -> Any:
+    """Turn raw little-endian float64 series back into the lists the JSON format carries."""
+    if isinstance(value, bytes):
+        return np.frombuffer(value, dtype="<f8").tolist()
+    if isinstance(value, dict):
+        return {key: _expand(item) for key, item in value.items()}
+    return value
+
+
+def decode(content: bytes, content_type: str) -> Any:
+    if content_type.startswith(MSGPACK):
+        return _expand(msgpack.unpackb(content))  # type: ignore
+    return None
@@ -0,0 +1,104 @@
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+
+class Event(NamedTuple):
+    """The outcome of a network call, tagged with the name it was submitted under."""
+
+    tag: str
+    result: Any = None
+    error: Optional[BaseException] = None
+
+
+class Worker:
+    """
+    Runs network calls off the UI thread. Finished calls are queued as Events and announced by
+    writing a byte to a pipe, so the curses loop can sleep in select() on the keyboard and
+    fileno() together instead of polling.
+    """
+
+    def __init__(self, max_workers: int = 4) -> None:
+        self.pool: ThreadPoolExecutor = ThreadPoolExecutor(
+            max_workers, thread_name_prefix="network"
+        )
+        self.events: "queue.SimpleQueue[Event]" = queue.SimpleQueue()
+        self.pollers: Dict[str, threading.Event] = {}
+        self._read, self._write = os.pipe()
+        os.set_blocking(self._read, False)
+        os.set_blocking(self._write, False)
+
+    def fileno(self) -> int:
+        return self._read
+
+    def wake(self) -> None:
+        try:
+            os.write(self._write, b"\0")
+        except BlockingIOError:
+            pass  # The pipe is full, so the reader is already awake
+
+    def post(self, event: Event) -> None:
+        self.events.put(event)
+        self.wake()
+
+    def submit(self, tag: str, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Future:
+        """Run fn on the pool; its result or exception arrives as an Event named tag."""
+
+        def done(future: Future) -> None:
+            if future.cancelled():
+                return
+            error = future.exception()
+            self.post(Event(tag, None if error else future.result(), error))
+
+        future = self.pool.submit(fn, *args, **kwargs)
+        future.add_done_callback(done)
+        return future
+
+    def every(self, tag: str, interval: float, fn: Callable[..., Any], *args: Any) -> None:
+        """Call fn every interval seconds on its own thread until cancelled, e.g. price polls."""
+        self.cancel(tag)
+        stopped = self.pollers[tag] = threading.Event()
+
+        def poll() -> None:
+            while not stopped.is_set():
+                started = time.monotonic()
+                try:
+                    event = Event(tag, fn(*args))
+                except Exception as e:
+                    event = Event(tag, error=e)
+                if not stopped.is_set():
+                    self.post(event)
+                stopped.wait(max(0.0, interval - (time.monotonic() - started)))
+
+        threading.Thread(target=poll, name=f"poll-{tag}", daemon=True).start()
+
+    def cancel(self, tag: str) -> None:
+        if (stopped := self.pollers.pop(tag, None)) is not None:
+            stopped.set()
+
+    def drain(self) -> List[Event]:
+        """Clear the wake-up pipe and return every Event posted since the last drain."""
+        try:
+            while os.read(self._read, 4096):
+                pass
+        except BlockingIOError:
+            pass
+
+        events = []
+        while True:
+            try:
+                events.append(self.events.get_nowait())
+            except queue.Empty:
+                return events
+
+    def shutdown(self) -> None:
+        for tag in list(self.pollers):
+            self.cancel(tag)
+        self.pool.shutdown(wait=False, cancel_futures=True)
+
+
+# Shared by the menus, like the pooled HTTP session
+worker: Worker = Worker()
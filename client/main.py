@@ -1,19 +1,44 @@
 import curses
+import os
+import selectors
+import signal
+import sys
+
 import menus
+from api.worker import worker
 from menus.menu_interface import MenuInterface
 from ui.canvas import Canvas
 from ui.palette import init_pairs
 
 
+def on_resize(signum: int, frame: object) -> None:
+    """
+    Handle SIGWINCH in Python so the selector wakes up: resize curses to the terminal and
+    queue the KEY_RESIZE that ncurses' own handler would have generated.
+    """
+    columns, lines = os.get_terminal_size(sys.__stdout__.fileno())
+    curses.resizeterm(lines, columns)
+    curses.ungetch(curses.KEY_RESIZE)
+    worker.wake()
+
+
 def main(stdscr: "curses.window") -> None:
     """
     Run the ncurses event loop: initialize menus, route input, and manage menu transitions.
+    The loop sleeps until a key is pressed or the network worker finishes a call, so neither
+    input nor server updates block each other.
     """
 
     canvas: Canvas = Canvas(stdscr)
     curses.curs_set(0)
     init_pairs()
 
+    selector = selectors.DefaultSelector()
+    selector.register(sys.stdin, selectors.EVENT_READ)
+    selector.register(worker.fileno(), selectors.EVENT_READ)
+    if hasattr(signal, "SIGWINCH"):
+        signal.signal(signal.SIGWINCH, on_resize)
+
     menu_registry: dict[str, type[MenuInterface]] = {
         name: getattr(menus, name) for name in menus.__all__
     }
@@ -27,24 +52,39 @@ def main(stdscr: "curses.window") -> None:
             current_menu = menu_registry[next_menu]()
 
         try:
-            # Draw the current menu
+            # Redraw the current menu into a fresh frame; only changed rows reach the terminal
             canvas.erase()
             current_menu.draw(canvas)
             curses.doupdate()
-            key = canvas.getch()
+
+            # Sleep until there is input or a network result to handle
+            selector.select()
+            for event in worker.drain():
+                current_menu.update(event)
+
+            # Read every buffered key; curses may already hold input stdin no longer shows
+            keys = []
+            while (key := canvas.getch()) != -1:
+                keys.append(key)
         except RuntimeError as e:
             # Catch navigation signal
-            key = int(str(e))
+            keys = [int(str(e))]
+
+        for key in keys:
+            # Rebuild canvas on resize
+            if key == curses.KEY_RESIZE:
+                canvas.clear()
+                canvas.refresh()
+                canvas.rebuild()
+                continue
 
-        # Rebuild canvas on resize
-        if key == curses.KEY_RESIZE:
-            canvas.clear()
-            canvas.refresh()
-            canvas.rebuild()
-            continue
+            # Route to the next menu; keys after a transition belong to the old menu
+            next_menu = current_menu.route(key)
+            if not next_menu or not isinstance(current_menu, menu_registry[next_menu]):
+                break
 
-        # Route to the next menu
-        next_menu = current_menu.route(key)
+    selector.close()
+    worker.shutdown()
 
 
 if __name__ == "__main__":
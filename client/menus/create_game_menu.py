@@ -1,7 +1,8 @@
-from pathlib import Path
 from typing import Any, Optional
 
 from api.admin import AdminAPI
+from api.worker import Event, worker
+from ui.assets import Art, art
 from ui.canvas import Canvas
 from ui.navigate import Navigation
 from ui.palette import Pairs
@@ -11,56 +12,68 @@ from menus.menu_interface import MenuInterface
 
 class CreateGameMenu(MenuInterface):
     nav: Navigation
-    header_lines: list[str]
+    header: Art
+    address: Optional[str]
+    pending: bool
+    lines: list[str]
+    pair: int
 
     def __init__(self) -> None:
         self.nav = Navigation(1)
-        self.header_lines = (
-            Path("ui/ascii_art/create_game.txt")
-            .read_text(encoding="utf-8")
-            .splitlines()
-        )
+        self.header = art("create_game")
+        self.address = None
+        self.pending = False
+        self.lines = []
+        self.pair = Pairs.STATIC
 
     def draw(self, canvas: Canvas) -> Any:
         canvas.erase()
-        canvas.draw_header_lines(self.header_lines)
+        canvas.draw_header_lines(self.header)
 
-        # with canvas.blocking():
-        address = canvas.draw_prompt("Enter server address: ")
-        admin_key = canvas.draw_prompt("Enter admin key: ")
-        epochs = canvas.draw_prompt("Enter number of epochs: ")
-        timestep = canvas.draw_prompt("Enter time between each epoch: ")
-        game_key = 123
+        if self.address is None:
+            with canvas.blocking():
+                address = canvas.draw_prompt("Enter server address: ")
+                admin_key = canvas.draw_prompt("Enter admin key: ")
+                epochs = canvas.draw_prompt("Enter number of epochs: ")
+                timestep = canvas.draw_prompt("Enter time between each epoch: ")
 
-        try:
-            api = AdminAPI(address, admin_key)
-            response = api.create_game(int(epochs), int(timestep))
-            game_key = response.get("game_key")
+            self.address = address
+            try:
+                api = AdminAPI(address, admin_key)
+                worker.submit("create_game", api.create_game, int(epochs), int(timestep))
+                self.pending = True
+                self.lines = ["Creating game..."]
+            except Exception as e:
+                self.fail(e)
 
-        except Exception as e:
-            canvas.clear()
-            AdminAPI.delete()
-            canvas.draw_lines([f"Error: {str(e)}"], pair=Pairs.WARNING)
-            #        with canvas.blocking():
-            canvas.getch()
-            raise RuntimeError(f"{Navigation.BACK}")
+            canvas.erase()
 
-        canvas.erase()
+        canvas.draw_lines(self.lines, pair=self.pair)
+
+        canvas.noutrefresh()
 
-        canvas.draw_lines(
-            [
-                "Share the following information with the players you want to join:",
-                "",
-                f"Server Address: {address}",
-                f"Game Key: {game_key}",
-            ],
-            pair=Pairs.STATIC,
-        )
+    def fail(self, error: BaseException) -> None:
+        AdminAPI.delete()
+        self.lines = [f"Error: {str(error)}"]
+        self.pair = Pairs.WARNING
 
-        # with canvas.blocking():
-        canvas.getch()
+    def update(self, event: Event) -> None:
+        if event.tag != "create_game":
+            return
+        self.pending = False
+        if event.error is not None:
+            self.fail(event.error)
+            return
 
-        canvas.noutrefresh()
+        self.lines = [
+            "Share the following information with the players you want to join:",
+            "",
+            f"Server Address: {self.address}",
+            f"Game Key: {event.result.get('game_key')}",
+        ]
 
     def route(self, key: int) -> Optional[Any]:
+        # Keys pressed while the game is being created are ignored
+        if self.pending:
+            return "CreateGameMenu"
         return "HostMenu"
@@ -1,6 +1,6 @@
-from pathlib import Path
 from typing import Any, Optional
 
+from ui.assets import Art, art
 from ui.canvas import Canvas
 from ui.navigate import Navigation
 
@@ -10,31 +10,30 @@ from menus.menu_interface import MenuInterface
 class HostMenu(MenuInterface):
     connected: bool
     options: list[str]
+    connected_options: list[str]
     nav: Navigation
-    header_lines: list[str]
+    header: Art
 
     def __init__(self) -> None:
         self.connected = False
         self.options = ["Create New Game", "Exit"]
+        self.connected_options = [
+            "Update Status",
+            "Start Game",
+            "End Game",
+            "Abort",
+            "Exit",
+        ]
         self.nav = Navigation(len(self.options))
-        self.header_lines = (
-            Path("ui/ascii_art/marketmayhem.txt")
-            .read_text(encoding="utf-8")
-            .splitlines()
-        )
+        self.header = art("marketmayhem")
 
     def draw(self, canvas: Canvas) -> None:
         canvas.erase()
-        canvas.draw_header_lines(self.header_lines)
-
-        if self.connected:
-            self.options = [
-                "Update Status",
-                "Start Game",
-                "End Game",
-                "Abort",
-                "Exit",
-            ]
+        canvas.draw_header_lines(self.header)
+
+        # Swap the options once on connecting; a new Navigation per frame loses the selection
+        if self.connected and self.options is not self.connected_options:
+            self.options = self.connected_options
             self.nav = Navigation(len(self.options))
 
         canvas.draw_menu(self.options, idx=self.nav.pos)
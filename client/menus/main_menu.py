@@ -1,6 +1,6 @@
-from pathlib import Path
 from typing import Any, Optional
 
+from ui.assets import Art, art
 from ui.canvas import Canvas
 from ui.navigate import Navigation
 
@@ -10,20 +10,16 @@ from menus.menu_interface import MenuInterface
 class MainMenu(MenuInterface):
     nav: Navigation
     options: list[str]
-    header_lines: list[str]
+    header: Art
 
     def __init__(self) -> None:
         self.options = ["Join Game", "Host Menu", "Exit"]
         self.nav = Navigation(len(self.options))
-        self.header_lines = (
-            Path("ui/ascii_art/marketmayhem.txt")
-            .read_text(encoding="utf-8")
-            .splitlines()
-        )
+        self.header = art("marketmayhem")
 
     def draw(self, canvas: Canvas) -> None:
         canvas.erase()
-        canvas.draw_header_lines(self.header_lines)
+        canvas.draw_header_lines(self.header)
         canvas.draw_menu(self.options, idx=self.nav.pos)
         canvas.noutrefresh()
 
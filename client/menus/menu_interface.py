@@ -7,3 +7,6 @@ class MenuInterface(ABC):
 
     @abstractmethod
     def route(self, key) -> "Menu|None": ...
+
+    def update(self, event) -> None:
+        """Receive the result of a network call submitted to the worker."""
@@ -0,0 +1,21 @@
+from functools import lru_cache
+from pathlib import Path
+from typing import NamedTuple
+
+ASCII_ART: Path = Path(__file__).parent / "ascii_art"
+
+
+class Art(NamedTuple):
+    lines: tuple[str, ...]
+    # Width of the widest line, so the block is centred as one piece
+    width: int
+
+
+@lru_cache(maxsize=None)
+def art(name: str) -> Art:
+    """
+    Load ui/ascii_art/<name>.txt the first time it is asked for and keep it for the rest of the
+    session, so switching menus does no file I/O.
+    """
+    lines = tuple((ASCII_ART / f"{name}.txt").read_text(encoding="utf-8").splitlines())
+    return Art(lines, max(map(len, lines), default=0))
@@ -1,19 +1,32 @@
 import curses
 from contextlib import contextmanager
-from typing import Any, Sequence
+from typing import Any, Optional, Sequence
 
+from ui.assets import Art
 from ui.palette import Pairs
 
 
+# A drawn row: (x, text, attributes)
+Row = tuple[int, str, int]
+
+
 class Canvas:
+    """
+    Retained-mode drawing surface. Draw calls record rows into a frame; presenting the frame
+    rewrites only the rows that differ from what is already on screen.
+    """
+
     stdscr: curses.window
     offset: int
     win: curses.window
     cursor: int
+    frame: dict[int, Row]
+    shown: dict[int, Row]
 
     def __init__(self, stdscr: curses.window) -> None:
         self.stdscr = stdscr
         self.offset = 0
+        self.frame = {}
         self._build()
 
     def _build(self) -> None:
@@ -21,44 +34,69 @@ class Canvas:
         h, w = y_max - self.offset - 1, x_max - 2
         self.win = curses.newwin(h, w, self.offset, 1)
         self.win.keypad(True)
+        # The main loop waits in select() and only reads what is already there
+        self.win.nodelay(True)
         self.cursor = 1
+        self.shown = {}
 
     rebuild = _build
 
     @contextmanager
-    def unblock(self):
-        self.win.nodelay(True)
-        self.win.timeout(10)
+    def blocking(self):
+        """Wait for input inside the block, e.g. for prompts; reads never block otherwise."""
+        self.win.nodelay(False)
         try:
             yield
         finally:
-            self.win.nodelay(False)
-            self.win.timeout(-1)
+            self.win.nodelay(True)
 
-    def _draw(self, text: str, pair: int = Pairs.BASE) -> None:
+    def _draw(self, text: str, pair: int = Pairs.BASE, width: Optional[int] = None) -> None:
         h, w = self.win.getmaxyx()
         if self.cursor >= h - 1:
             return
 
-        self.win.move(self.cursor, 0)
-        self.win.clrtoeol()
-
-        x = max(0, (w - len(text)) // 2)
+        x = max(0, (w - (width or len(text))) // 2)
 
-        self.win.addnstr(self.cursor, x, text, w - x - 1, pair)
+        self.frame[self.cursor] = (x, text, pair)
         self.cursor += 1
 
-    def draw_lines(
-        self, lines: Sequence[str], *, pair: int = Pairs.STATIC, pad: int = 1
-    ) -> None:
+    def present(self) -> None:
+        """Write the rows of the frame that changed since the last present to the window."""
+        _, w = self.win.getmaxyx()
+
+        for y in self.frame.keys() | self.shown.keys():
+            row = self.frame.get(y)
+            if row == self.shown.get(y):
+                continue
+
+            self.win.move(y, 0)
+            self.win.clrtoeol()
+            if row:
+                x, text, attr = row
+                self.win.addnstr(y, x, text, w - x - 1, attr)
+
+        self.shown = dict(self.frame)
+
+    def noutrefresh(self) -> None:
+        self.present()
+        self.win.noutrefresh()
+
+    def getch(self) -> int:
+        self.present()
+        return self.win.getch()
+
+    def draw_lines(self, lines: Sequence[str], *, pair: int = Pairs.STATIC, pad: int = 1) -> None:
         base = curses.color_pair(pair)
         for line in lines:
             self._draw(line, base)
         self.cursor += pad
 
-    def draw_header_lines(self, lines: Sequence[str]) -> None:
+    def draw_header_lines(self, header: Art) -> None:
         self.cursor = 1
-        self.draw_lines(lines, pair=Pairs.BASE)
+        base = curses.color_pair(Pairs.BASE)
+        for line in header.lines:
+            self._draw(line, base, header.width)
+        self.cursor += 1
         self.offset = self.cursor
 
     def draw_menu(
@@ -79,6 +117,7 @@ class Canvas:
         _, w = self.win.getmaxyx()
         attr = curses.color_pair(pair)
         x = max(0, (w - (len(prompt) + 1)) // 2)
+        self.present()
         self.win.addnstr(self.cursor, x, prompt + " ", w - x - 1, attr)
         self.win.refresh()
 
@@ -88,14 +127,21 @@ class Canvas:
         curses.noecho()
 
         text = raw.decode("utf-8", errors="ignore")
+        # The prompt and its echoed answer are already on screen
+        self.frame[self.cursor] = self.shown[self.cursor] = (x, f"{prompt} {text}", attr)
         self.cursor += 1
 
         return text
 
     def erase(self) -> None:
-        self.win.move(self.offset, 0)
-        self.win.clrtobot()
+        """Start a new frame below the header; nothing is written until it is presented."""
+        self.frame = {y: row for y, row in self.frame.items() if y < self.offset}
         self.cursor = self.offset
 
+    def clear(self) -> None:
+        self.win.clear()
+        self.frame = {}
+        self.shown = {}
+
     def __getattr__(self, name: str) -> Any:
         return getattr(self.win, name)
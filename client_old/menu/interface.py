@@ -1,5 +1,5 @@
 import curses
-from functools import wraps
+from functools import lru_cache, wraps
 from typing import Any, Callable, List, Union
 
 
@@ -12,7 +12,9 @@ def get_input(stdscr: curses.window, prompt: str, y: int, x: int) -> str:
     return s
 
 
+@lru_cache(maxsize=None)
 def load_header(path: str) -> List[str]:
+    # Cached per path; callers only read the returned list
     try:
         with open(path) as f:
             return [line.rstrip("\n") for line in f]
@@ -1,7 +1,18 @@
-from flask import Flask
+import time
+
+from flask import Flask, Response, g, request
+
+from game.exchange import Exchange, account_dtypes
+from game.recovery import recover
+from game.metrics import metrics
+from game.registry import GameRegistry
+from game.scheduler import scheduler
 from app.config import Config
 from app.routes import routes
-from app.db import db
+from app.db import add_missing_columns, db
+from app.game import archiver, games, journal
+from app.scoreboard import scoreboards
+from app.sessions import sessions
 
 
 def create_app():
@@ -9,10 +20,35 @@ def create_app():
     app.config.from_object(Config)
 
     db.init_app(app)
+    scheduler.policy = app.config["TICK_POLICY"]
+    Exchange.dtypes = account_dtypes(app.config["POSITION_DTYPE"], app.config["METRIC_DTYPE"])
 
     with app.app_context():
         db.create_all()
+        add_missing_columns()
+        sessions.load()
+
+    if archiver:
+        games.update(archiver.load())
+        archiver.watch(games)
+
+    if journal:
+        games.update(recover(journal, exclude=games))
+
+    if isinstance(games, GameRegistry):
+        games.on_evict.append(scoreboards.discard)
+        games.watch()
 
     app.register_blueprint(routes)
 
+    @app.before_request
+    def start_timer() -> None:
+        g.request_start = time.perf_counter()
+
+    @app.after_request
+    def record_latency(response: Response) -> Response:
+        if request.url_rule:
+            metrics.observe(f"route.{request.url_rule.rule}", time.perf_counter() - g.request_start)
+        return response
+
     return app
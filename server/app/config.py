@@ -10,5 +10,30 @@ class Config:
 
     ADMIN_KEY: str = os.environ.get("ADMIN_KEY") or ""
 
+    # Number of worker processes to shard games across; 0 keeps every game in-process
+    GAME_SHARDS: int = int(os.environ.get("GAME_SHARDS") or 0)
+
+    # Append-only log used to rebuild running games after a restart, e.g.
+    # "market_mayhem.journal"; empty (the default) disables it
+    JOURNAL_PATH: str = os.environ.get("JOURNAL_PATH", "")
+
+    # Directory finished games are archived to and served from, e.g. "market_mayhem_archive";
+    # empty (the default) keeps them in memory
+    ARCHIVE_DIR: str = os.environ.get("ARCHIVE_DIR", "")
+
+    # How the tick loop handles epochs it fell behind on: "catch_up" or "skip"
+    TICK_POLICY: str = os.environ.get("TICK_POLICY", "catch_up")
+
+    # Seconds a game that is not running may sit idle before it is evicted; 0 disables it
+    GAME_TTL: float = float(os.environ.get("GAME_TTL") or 3600)
+
+    # Bytes of engine state to keep in memory before evicting idle games; 0 disables it
+    GAME_MEMORY_BUDGET: int = int(os.environ.get("GAME_MEMORY_BUDGET") or 0)
+
+    # Storage of per-player arrays: a signed integer type for positions and leverage, and a
+    # float type for portfolio values ("float32" halves it again at some precision cost)
+    POSITION_DTYPE: str = os.environ.get("POSITION_DTYPE", "int8")
+    METRIC_DTYPE: str = os.environ.get("METRIC_DTYPE", "float64")
+
     if not ADMIN_KEY:
         raise ValueError("ADMIN_KEY is not set!")
@@ -1,3 +1,30 @@
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import inspect, text
 
 db = SQLAlchemy()
+
+
+def add_missing_columns() -> None:
+    """
+    `create_all` only creates missing tables, so a database made by an older version lacks
+    columns added to the models since. Nullable ones are added in place; any other missing
+    column stops startup with the name of the table to migrate.
+    """
+    inspector = inspect(db.engine)
+    for table in db.metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            continue
+        existing = {column["name"] for column in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name in existing:
+                continue
+            if not column.nullable:
+                raise RuntimeError(
+                    f"Table {table.name} has no {column.name} column; migrate or recreate "
+                    f"{db.engine.url.database}"
+                )
+            column_type = column.type.compile(dialect=db.engine.dialect)
+            db.session.execute(
+                text(f"ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}")
+            )
+    db.session.commit()
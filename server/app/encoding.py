@@ -0,0 +1,43 @@
+from typing import Any, Dict
+
+import numpy as np
+from flask import Response, jsonify, request
+from werkzeug.datastructures import MIMEAccept
+from werkzeug.http import parse_accept_header
+
+try:
+    import msgpack
+except ImportError:  # Responses stay JSON-only
+    msgpack = None
+
+JSON = "application/json"
+MSGPACK = "application/msgpack"
+
+
+def accepts_msgpack(accept: str) -> bool:
+    """Whether an Accept header prefers MessagePack over JSON. Ties go to JSON."""
+    if msgpack is None or not accept:
+        return False
+    return parse_accept_header(accept, MIMEAccept).best_match([JSON, MSGPACK]) == MSGPACK
+
+
+def wants_msgpack() -> bool:
+    return accepts_msgpack(request.headers.get("Accept", ""))
+
+
+def encode_series(values: np.ndarray, binary: bool) -> Any:
+    """A float series as a JSON list, or as raw little-endian float64 bytes for MessagePack."""
+    if binary:
+        return np.ascontiguousarray(values, dtype="<f8").tobytes()
+    # Compact integer and float32 storage still serializes as float64 numbers
+    return values.astype(float, copy=False).tolist()
+
+
+def pack(payload: Dict[str, Any]) -> bytes:
+    return msgpack.packb(payload)  # type: ignore
+
+
+def respond(payload: Dict[str, Any], binary: bool) -> Response:
+    if binary:
+        return Response(pack(payload), mimetype=MSGPACK)
+    return jsonify(payload)
@@ -1,5 +1,41 @@
-from typing import Dict
+from typing import Any, MutableMapping, Optional
 
+from app.config import Config
+from game.archive import Archiver
 from game.engine import GameEngine
+from game.exchange import account_dtypes
+from game.journal import Journal
+from game.registry import GameRegistry
+from game.shards import ShardedGames
 
-games: Dict[str, GameEngine] = {}
+# Sharded games are journaled and archived by their worker processes instead
+journal: Optional[Journal] = (
+    Journal(Config.JOURNAL_PATH) if Config.JOURNAL_PATH and not Config.GAME_SHARDS else None
+)
+
+archiver: Optional[Archiver] = (
+    Archiver(Config.ARCHIVE_DIR) if Config.ARCHIVE_DIR and not Config.GAME_SHARDS else None
+)
+
+games: MutableMapping[str, Any] = (
+    ShardedGames(
+        Config.GAME_SHARDS,
+        Config.JOURNAL_PATH,
+        Config.ARCHIVE_DIR,
+        (Config.GAME_TTL, Config.GAME_MEMORY_BUDGET),
+        Config.TICK_POLICY,
+        account_dtypes(Config.POSITION_DTYPE, Config.METRIC_DTYPE),
+    )
+    if Config.GAME_SHARDS
+    else GameRegistry(Config.GAME_TTL, Config.GAME_MEMORY_BUDGET)
+)
+
+
+def add_game(game_key: str, epochs: int, timestep: int, seed: int) -> None:
+    """Register a waiting game. A sharded game's arrays are only allocated in its worker."""
+    if isinstance(games, ShardedGames):
+        games.create(game_key, epochs, timestep, seed)
+    else:
+        games[game_key] = GameEngine(
+            epochs, timestep, seed, journal=journal.game(game_key) if journal else None
+        )
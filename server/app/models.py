@@ -12,6 +12,8 @@ class Lobby(db.Model):
         nullable=False,
         default=lambda: uuid.uuid4().hex[:8],
     )
+    # Seed of the game's market noise; replaying a game with it reproduces every price
+    seed = db.Column(db.BigInteger, nullable=True)
 
     players = db.relationship("Player", backref="lobby", lazy=True, cascade="all, delete-orphan")
 
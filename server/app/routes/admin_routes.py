@@ -3,10 +3,14 @@ from typing import Any, Dict, Tuple
 from flask import Blueprint, Response, jsonify, request
 
 from app.db import db
-from app.game import games
+from app.game import add_game, games
 from app.models import Lobby, Player
+from app.scoreboard import scoreboards
+from app.sessions import sessions
 from app.validators import AdminValidators
-from game.engine import GameEngine
+from game.metrics import metrics
+from game.shards import ShardedGames
+from game.rng import new_seed
 
 admin_routes = Blueprint("admin_routes", __name__)
 
@@ -21,17 +25,21 @@ def create_game() -> Response:
         .validate_admin_key()
         .validate_epochs()
         .validate_timestep()
+        .validate_seed()
         .check_errors()
     )
 
-    lobby: Lobby = Lobby()
+    seed: int = data["seed"] if data.get("seed") is not None else new_seed()
+    lobby: Lobby = Lobby(seed=seed)
     db.session.add(lobby)
     db.session.commit()
+    sessions.add_game(lobby.key)
 
-    games[lobby.key] = GameEngine(data["epochs"], data["timestep"])
+    add_game(lobby.key, data["epochs"], data["timestep"], seed)
 
-    response_data: Dict[str, str] = {
+    response_data: Dict[str, Any] = {
         "game_key": lobby.key,
+        "seed": seed,
     }
     return jsonify(response_data)
 
@@ -52,6 +60,8 @@ def start_game() -> Response:
     players = db.session.query(Player).filter_by(game_key=data["game_key"]).all()
     player_keys = [player.key for player in players]
     games[data["game_key"]].start(player_keys)
+    # Accounts are added at epoch 0, so a scoreboard cached while waiting would stay current
+    scoreboards.discard(data["game_key"])
 
     return jsonify({"message": "The game has started"})
 
@@ -71,3 +81,30 @@ def stop_game() -> Response:
     games[data["game_key"]].stop()
 
     return jsonify({"message": "The game has stopped"})
+
+
+@admin_routes.route("/registry_stats", methods=["POST"])
+def registry_stats() -> Response:
+    data: Dict[str, Any] = request.get_json() or {}
+    validators = AdminValidators(data)
+
+    validators.require_fields(["admin_key"]).validate_admin_key().check_errors()
+
+    return jsonify(games.stats())
+
+
+@admin_routes.route("/metrics", methods=["POST"])
+def get_metrics() -> Response:
+    data: Dict[str, Any] = request.get_json() or {}
+    validators = AdminValidators(data)
+
+    validators.require_fields(["admin_key"]).validate_admin_key().check_errors()
+
+    response: Dict[str, Any] = {"server": metrics.snapshot()}
+    if isinstance(games, ShardedGames):
+        response["shards"] = games.metrics()
+
+    if data.get("reset"):
+        metrics.reset()
+
+    return jsonify(response)
@@ -1,11 +1,14 @@
-from typing import Any, Dict
+import json
+from typing import Any, Dict, Iterator, List, Tuple
 
-import numpy as np
 from flask import Blueprint, Response, jsonify, request
 
 from app.db import db
+from app.encoding import JSON, MSGPACK, respond, wants_msgpack
 from app.game import games
 from app.models import Player
+from app.scoreboard import scoreboards
+from app.sessions import sessions
 from app.validators import GameValidators
 
 game_routes = Blueprint("game_routes", __name__)
@@ -27,6 +30,7 @@ def join_game() -> Response:
     new_player = Player(name=data["player_name"], game_key=data["game_key"])  # type: ignore
     db.session.add(new_player)
     db.session.commit()
+    sessions.add_player(data["game_key"], new_player.key)
 
     return jsonify(
         {
@@ -104,7 +108,33 @@ def get_latest_price() -> Response:
     epoch, latest_price = games[data["game_key"]].exchange.get_latest_price()
 
     response: Dict[str, int | float] = {"epoch": epoch, "price": latest_price}
-    return jsonify(response)
+    return respond(response, wants_msgpack())
+
+
+@game_routes.route("/subscribe_price", methods=["GET"])
+def subscribe_price() -> Response:
+    data: Dict[str, Any] = request.args.to_dict()
+    validators = GameValidators(data)
+
+    (
+        validators.require_fields(["game_key", "player_key"])
+        .validate_game_key()
+        .validate_player_key()
+        .check_errors()
+    )
+
+    feed = games[data["game_key"]].exchange.feed
+
+    def stream() -> Iterator[str]:
+        for update in feed.subscribe(timeout=15):
+            if update is None:
+                yield ": keep-alive\n\n"
+                continue
+            epoch, price = update
+            yield f"data: {json.dumps({'epoch': epoch, 'price': price})}\n\n"
+        yield "event: close\ndata: {}\n\n"
+
+    return Response(stream(), mimetype="text/event-stream", headers={"Cache-Control": "no-cache"})
 
 
 @game_routes.route("/trade", methods=["POST"])
@@ -127,41 +157,84 @@ def trade() -> Response:
     return jsonify({"epoch": epoch, "leverage": leverage})
 
 
+@game_routes.route("/trade_batch", methods=["POST"])
+def trade_batch() -> Response:
+    data: Dict[str, Any] = request.get_json() or {}
+    validators = GameValidators(data)
+
+    (
+        validators.require_fields(["game_key", "orders"])
+        .validate_game_key()
+        .validate_orders()
+        .check_errors()
+    )
+
+    game_key = data["game_key"]
+    exchange = games[game_key].exchange
+    results: List[Dict[str, Any]] = []
+    accepted: List[Tuple[int, Tuple[str, int]]] = []
+
+    for i, order in enumerate(data["orders"]):
+        player_key, position = order.get("player_key"), order.get("position")
+        results.append({"player_key": player_key})
+
+        # Keys are looked up in dicts, and JSON true/false would pass as ints
+        if not isinstance(player_key, str):
+            results[i]["error"] = "Player key must be a string."
+        elif not isinstance(position, int) or isinstance(position, bool):
+            results[i]["error"] = "Position must be an integer."
+        else:
+            accepted.append((i, (player_key, position)))
+
+    epoch, leverages = exchange.trade_many([order for _, order in accepted])
+
+    for (i, (player_key, _)), leverage in zip(accepted, leverages):
+        # Only players who were in the lobby when the game started hold an account
+        if leverage is None:
+            results[i]["error"] = f"Player '{player_key}' not found in session '{game_key}'."
+        else:
+            results[i]["leverage"] = leverage
+
+    return jsonify({"epoch": epoch, "results": results})
+
+
 @game_routes.route("/get_scoreboard", methods=["POST"])
 def get_scoreboard() -> Response:
     data: Dict[str, Any] = request.get_json() or {}
     validators = GameValidators(data)
-    validators.require_fields(["game_key"]).validate_game_key().check_errors()
-
-    engine = games[data["game_key"]]
-    accounts = engine.exchange.accounts
-    market = engine.exchange.market
-    log_returns = market.log_return
-    start_price = engine.exchange.start_price
-
-    price_series = np.exp(np.cumsum(log_returns)) * start_price
-
-    def forward_fill(arr: np.ndarray) -> np.ndarray:
-        mask = ~np.isnan(arr)
-        idx = np.maximum.accumulate(np.where(mask, np.arange(len(arr)), 0))
-        return arr[idx]
-
-    scoreboard: Dict[str, Any] = {}
-
-    for player_key, account in accounts.items():
-        player = Player.query.filter_by(game_key=data["game_key"]).first()
-        player_name = player.name  # type: ignore
-        position_changes = np.array(account["positions"])
-        positions = forward_fill(np.cumsum(position_changes))
-        portfolio = start_price * np.exp(np.cumsum(positions * log_returns))
-
-        scoreboard[player_key] = {
-            "positions": positions.tolist(),
-            "portfolio": portfolio.tolist(),
-            "score": portfolio[-1],
-            "name": player_name,
-        }
+    (
+        validators.require_fields(["game_key"])
+        .validate_game_key()
+        .validate_since_epoch()
+        .check_errors()
+    )
+
+    binary = wants_msgpack()
+    body = scoreboards.get(
+        data["game_key"], games[data["game_key"]], data.get("since_epoch", 0), binary
+    )
+
+    return Response(body, mimetype=MSGPACK if binary else JSON)
 
-    scoreboard["price"] = {"series": price_series.tolist(), "start_price": start_price}
 
-    return jsonify(scoreboard)
+@game_routes.route("/get_replay", methods=["POST"])
+def get_replay() -> Response:
+    data: Dict[str, Any] = request.get_json() or {}
+    validators = GameValidators(data)
+    (
+        validators.require_fields(["game_key"])
+        .validate_game_key()
+        .validate_since_epoch()
+        .check_errors()
+    )
+
+    since_epoch = data.get("since_epoch", 0)
+    epoch, series = games[data["game_key"]].exchange.get_replay(since_epoch)
+
+    return jsonify(
+        {
+            "epoch": epoch,
+            "since_epoch": since_epoch,
+            "series": {name: values.tolist() for name, values in series.items()},
+        }
+    )
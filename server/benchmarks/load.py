@@ -0,0 +1,158 @@
+import argparse
+import http.client
+import json
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+
+class Client:
+    """Keep-alive HTTP connection that records the latency of every request by route."""
+
+    def __init__(self, base_url: str) -> None:
+        url = urlsplit(base_url)
+        self.host: str = url.hostname or "localhost"
+        self.port: int = url.port or 80
+        self.conn: Optional[http.client.HTTPConnection] = None
+        self.latencies: Dict[str, List[float]] = {}
+        self.errors: Dict[str, int] = {}
+
+    def post(self, route: str, payload: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        body = json.dumps(payload)
+        start = time.perf_counter()
+        try:
+            if self.conn is None:
+                self.conn = http.client.HTTPConnection(self.host, self.port, timeout=30)
+            self.conn.request(
+                "POST", f"/{route}", body, headers={"Content-Type": "application/json"}
+            )
+            response = self.conn.getresponse()
+            data = json.loads(response.read() or b"null")
+            ok = response.status == 200
+        except (OSError, http.client.HTTPException, ValueError):
+            # Reconnect on the next request
+            if self.conn is not None:
+                self.conn.close()
+            self.conn, data, ok = None, None, False
+
+        self.latencies.setdefault(route, []).append(time.perf_counter() - start)
+        if not ok:
+            self.errors[route] = self.errors.get(route, 0) + 1
+        return data if ok else None
+
+
+def setup(
+    base_url: str, admin_key: str, games: int, players: int, epochs: int, workers: int
+) -> Tuple[List[Tuple[str, str]], List[Client]]:
+    """Create, join and start the games, returning (game_key, player_key) pairs."""
+    admin = Client(base_url)
+    game_keys = []
+    for _ in range(games):
+        created = admin.post(
+            "create_game", {"admin_key": admin_key, "epochs": epochs, "timestep": 1}
+        )
+        if created is None:
+            raise SystemExit("Could not create a game; check --url and --admin-key")
+        game_keys.append(created["game_key"])
+
+    local = threading.local()
+    clients: List[Client] = []
+
+    def join(seat: Tuple[str, int]) -> Optional[Tuple[str, str]]:
+        if not hasattr(local, "client"):
+            local.client = Client(base_url)
+            clients.append(local.client)
+        game_key, i = seat
+        joined = local.client.post("join_game", {"game_key": game_key, "player_name": f"p{i:05}"})
+        return (game_key, joined["player_key"]) if joined else None
+
+    seats = [(game_key, i) for game_key in game_keys for i in range(players)]
+    with ThreadPoolExecutor(workers) as pool:
+        joined = [seat for seat in pool.map(join, seats) if seat]
+
+    for game_key in game_keys:
+        admin.post("start_game", {"admin_key": admin_key, "game_key": game_key})
+
+    return joined, [admin, *clients]
+
+
+def trader(
+    client: Client, players: List[Tuple[str, str]], poll_ratio: float, deadline: float
+) -> None:
+    rng = random.Random()
+    while time.monotonic() < deadline:
+        game_key, player_key = rng.choice(players)
+        if rng.random() < poll_ratio:
+            client.post("get_latest_price", {"game_key": game_key, "player_key": player_key})
+        else:
+            # A zero position counts as a missing field, so only non-zero orders are sent
+            position = rng.choice((-1, 1))
+            client.post(
+                "trade", {"game_key": game_key, "player_key": player_key, "position": position}
+            )
+
+
+def report(clients: List[Client], elapsed: Optional[float] = None) -> None:
+    routes = sorted({route for client in clients for route in client.latencies})
+    total = 0
+
+    print(f"{'route':<20} {'requests':>9} {'errors':>7} {'req/s':>9} {'p50 ms':>9} {'p99 ms':>9}")
+    for route in routes:
+        samples = sorted(s for client in clients for s in client.latencies.get(route, []))
+        errors = sum(client.errors.get(route, 0) for client in clients)
+        p50 = samples[len(samples) // 2] * 1e3
+        p99 = samples[min(len(samples) - 1, int(len(samples) * 0.99))] * 1e3
+        rate = f"{len(samples) / elapsed:>9.0f}" if elapsed else f"{'':>9}"
+        print(f"{route:<20} {len(samples):>9} {errors:>7} {rate} {p50:>9.2f} {p99:>9.2f}")
+        total += len(samples)
+
+    if elapsed:
+        print(f"{'total':<20} {total:>9} {'':>7} {total / elapsed:>9.0f}")
+
+
+def run(args: argparse.Namespace) -> None:
+    started = time.monotonic()
+    players, setup_clients = setup(
+        args.url, args.admin_key, args.games, args.players, args.epochs, args.workers
+    )
+    print(
+        f"Setup: {len(players)} players in {args.games} games ({time.monotonic() - started:.1f}s)"
+    )
+    report(setup_clients)
+    print()
+
+    clients = [Client(args.url) for _ in range(args.workers)]
+    deadline = time.monotonic() + args.duration
+    started = time.monotonic()
+    threads = [
+        threading.Thread(target=trader, args=(client, players, args.poll_ratio, deadline))
+        for client in clients
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    print(f"Load: {args.workers} workers for {args.duration:.0f}s")
+    report(clients, time.monotonic() - started)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Drive create/join/start/trade/poll traffic against a running server and "
+        "report latency percentiles and throughput per route."
+    )
+    parser.add_argument("--url", default="http://localhost:5000")
+    parser.add_argument("--admin-key", required=True)
+    parser.add_argument("--games", type=int, default=10)
+    parser.add_argument("--players", type=int, default=200, help="players per game")
+    parser.add_argument("--epochs", type=int, default=600)
+    parser.add_argument("--workers", type=int, default=32, help="concurrent connections")
+    parser.add_argument("--duration", type=float, default=30.0)
+    parser.add_argument("--poll-ratio", type=float, default=0.5, help="share of price polls")
+    args = parser.parse_args()
+
+    run(args)
@@ -0,0 +1,161 @@
+import argparse
+import os
+import statistics
+import sys
+import time
+from typing import Callable, List
+
+import numpy as np
+
+# Run as a script, only benchmarks/ is on the path; the app and game packages live one up
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# The app config refuses to load without an admin key; journaling and archiving stay off
+os.environ.setdefault("ADMIN_KEY", "benchmark")
+os.environ.setdefault("JOURNAL_PATH", "")
+os.environ.setdefault("ARCHIVE_DIR", "")
+
+from flask import Flask  # noqa: E402
+
+from app.config import Config  # noqa: E402
+from app.db import db  # noqa: E402
+from app.game import games  # noqa: E402
+from app.models import Lobby, Player  # noqa: E402
+from app.scoreboard import scoreboards  # noqa: E402
+from app.sessions import sessions  # noqa: E402
+from app.validators import GameValidators  # noqa: E402
+from game.engine import GameEngine  # noqa: E402
+from game.exchange import Exchange  # noqa: E402
+from game.market import Market  # noqa: E402
+
+
+def report(name: str, samples: List[float]) -> None:
+    """Print per-call timings in microseconds."""
+    micros = sorted(sample * 1e6 for sample in samples)
+    p99 = micros[min(len(micros) - 1, int(len(micros) * 0.99))]
+    print(
+        f"{name:<44} {statistics.fmean(micros):>10.1f} {micros[len(micros) // 2]:>10.1f}"
+        f" {p99:>10.1f} {len(micros):>8}"
+    )
+
+
+def measure(call: Callable[[], object], calls: int) -> List[float]:
+    samples = []
+    for _ in range(calls):
+        start = time.perf_counter()
+        call()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def bench_update_state(players: int, epochs: int, repeat: int) -> None:
+    """Time every Market.update_state call of full games with random trading."""
+    rng = np.random.default_rng(0)
+    samples: List[float] = []
+
+    for _ in range(repeat):
+        exchange = Exchange(Market(epochs))
+        exchange.add_player_accounts([f"player{i}" for i in range(players)])
+        exchange.positions[:] = rng.integers(-2, 3, exchange.positions.shape)
+
+        for _ in range(epochs):
+            start = time.perf_counter()
+            exchange.market.update_state()
+            samples.append(time.perf_counter() - start)
+
+    report(f"update_state players={players} epochs={epochs}", samples)
+
+
+def bench_scoreboard(app: Flask, players: int, epochs: int, calls: int) -> None:
+    """Time get_scoreboard plus serialization, uncached and cached."""
+    with app.app_context():
+        lobby = Lobby()
+        db.session.add(lobby)
+        db.session.commit()
+        rows = [Player(name=f"player{i}", game_key=lobby.key) for i in range(players)]
+        db.session.add_all(rows)
+        db.session.commit()
+        keys = [player.key for player in rows]
+
+        engine = GameEngine(epochs, 1)
+        engine.exchange.add_player_accounts(keys)
+        engine.status = "running"
+        for _ in range(epochs):
+            engine.exchange.update_market()
+
+        def uncached() -> None:
+            scoreboards.discard(lobby.key)
+            scoreboards.get(lobby.key, engine)
+
+        # Rebuilding is slow for large games, so it gets fewer calls
+        rebuilds = max(10, calls // players)
+        report(f"scoreboard players={players} uncached", measure(uncached, rebuilds))
+        report(
+            f"scoreboard players={players} cached",
+            measure(lambda: scoreboards.get(lobby.key, engine), calls),
+        )
+        report(
+            f"scoreboard players={players} since_epoch",
+            measure(lambda: scoreboards.get(lobby.key, engine, epochs - 5), calls),
+        )
+
+
+def bench_validators(app: Flask, calls: int) -> None:
+    """Time the game/player validator chain that guards the trading routes."""
+    with app.app_context():
+        lobby = Lobby()
+        db.session.add(lobby)
+        db.session.commit()
+        player = Player(name="validator", game_key=lobby.key)
+        db.session.add(player)
+        db.session.commit()
+
+        sessions.add_game(lobby.key)
+        sessions.add_player(lobby.key, player.key)
+        games[lobby.key] = GameEngine(60, 1)
+        data = {"game_key": lobby.key, "player_key": player.key, "position": 1}
+
+        def chain() -> None:
+            (
+                GameValidators(data)
+                .require_fields(["game_key", "player_key", "position"])
+                .validate_game_key()
+                .validate_player_key()
+                .validate_position()
+                .check_errors()
+            )
+
+        with app.test_request_context():
+            report("validators game/player/position", measure(chain, calls))
+
+
+def create_bench_app() -> Flask:
+    app = Flask(__name__)
+    app.config.from_object(Config)
+    app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite://"
+    db.init_app(app)
+    with app.app_context():
+        db.create_all()
+    return app
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Micro-benchmarks of the server hot paths, timed per call in microseconds. "
+        "Run as `python benchmarks/micro.py` or, from server/, `python -m benchmarks.micro`."
+    )
+    parser.add_argument("--players", type=int, nargs="+", default=[1, 10, 100, 1000])
+    parser.add_argument("--epochs", type=int, nargs="+", default=[60, 600])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--calls", type=int, default=1000)
+    args = parser.parse_args()
+
+    app = create_bench_app()
+
+    print(f"{'benchmark':<44} {'mean µs':>10} {'p50 µs':>10} {'p99 µs':>10} {'calls':>8}")
+    for epochs in args.epochs:
+        for players in args.players:
+            bench_update_state(players, epochs, args.repeat)
+    for players in args.players:
+        bench_scoreboard(app, players, max(args.epochs), args.calls)
+    bench_validators(app, args.calls)
@@ -0,0 +1,206 @@
+import json
+import logging
+import os
+import threading
+import time
+from functools import cached_property, lru_cache
+from typing import Any, Dict, List, MutableMapping, Optional, Tuple
+
+import numpy as np
+
+from game.engine import GameEngine
+from game.feed import PriceFeed
+from game.market import Market
+from game.metrics import metrics
+
+log = logging.getLogger(__name__)
+
+
+def write_archive(directory: str, game_key: str, engine: GameEngine) -> None:
+    """
+    Compact a finished game into `<key>.npy`, one float64 row per series (market series, price,
+    then per-player position changes, holdings and portfolio), plus a `<key>.json` sidecar.
+    """
+    exchange = engine.exchange
+    market = exchange.market
+    players = sorted(exchange.index, key=exchange.index.__getitem__)
+
+    matrix = np.vstack(
+        [
+            *(getattr(market, name) for name in Market.SERIES),
+            exchange.prices,
+            exchange.positions,
+            exchange.holdings,
+            exchange.portfolio,
+        ]
+    ).astype(np.float64, copy=False)
+
+    meta = {
+        "epoch": market.epoch,
+        "epochs": market.epochs,
+        "timestep": engine.timestep,
+        "start_price": exchange.start_price,
+        "players": players,
+        "leverage": exchange.leverage.tolist(),
+    }
+
+    path = os.path.join(directory, game_key)
+    np.save(f"{path}.tmp.npy", matrix)
+    os.replace(f"{path}.tmp.npy", f"{path}.npy")
+    with open(f"{path}.tmp.json", "w", encoding="utf-8") as file:
+        json.dump(meta, file)
+    os.replace(f"{path}.tmp.json", f"{path}.json")
+
+
+# Archives kept memory-mapped at once. Each map holds a file descriptor until it is dropped,
+# so mapping every archive ever read would exhaust the process's descriptors.
+OPEN_ARCHIVES = 64
+
+
+@lru_cache(maxsize=OPEN_ARCHIVES)
+def open_matrix(path: str) -> np.ndarray:
+    return np.load(f"{path}.npy", mmap_mode="r")
+
+
+class ArchivedExchange:
+    """Read-only Exchange view of an archived game, backed by a memory-mapped matrix."""
+
+    def __init__(self, path: str) -> None:
+        self.path: str = path
+
+    @cached_property
+    def meta(self) -> Dict[str, Any]:
+        with open(f"{self.path}.json", encoding="utf-8") as file:
+            return json.load(file)
+
+    @property
+    def matrix(self) -> np.ndarray:
+        # Views handed out keep their map open until the caller drops them
+        return open_matrix(self.path)
+
+    @cached_property
+    def index(self) -> Dict[str, int]:
+        return {key: row for row, key in enumerate(self.meta["players"])}
+
+    @cached_property
+    def feed(self) -> PriceFeed:
+        feed = PriceFeed()
+        feed.publish(*self.get_latest_price())
+        feed.close()
+        return feed
+
+    @property
+    def start_price(self) -> float:
+        return self.meta["start_price"]
+
+    def _rows(self, name: str) -> np.ndarray:
+        series = len(Market.SERIES)
+        players = len(self.meta["players"])
+        if name in Market.SERIES:
+            return self.matrix[Market.SERIES.index(name)]
+        if name == "price":
+            return self.matrix[series]
+        offset = series + 1 + players * ("positions", "holdings", "portfolio").index(name)
+        return self.matrix[offset : offset + players]
+
+    def get_latest_price(self) -> Tuple[int, float]:
+        epoch = self.meta["epoch"]
+        return epoch, float(self._rows("price")[epoch])
+
+    def get_scoreboard(self, since_epoch: int = 0) -> Tuple[int, Dict[str, Any]]:
+        epoch = self.meta["epoch"]
+        end = epoch + 1
+        start = min(since_epoch, end)
+        return epoch, {
+            "index": self.index,
+            "positions": self._rows("holdings")[:, start:end],
+            "portfolio": self._rows("portfolio")[:, start:end],
+            "price": self._rows("price")[start:end],
+            "score": self._rows("portfolio")[:, epoch],
+        }
+
+    def get_replay(self, since_epoch: int = 0) -> Tuple[int, Dict[str, np.ndarray]]:
+        epoch = self.meta["epoch"]
+        end = epoch + 1
+        start = min(since_epoch, end)
+        return epoch, {name: self._rows(name)[start:end] for name in (*Market.SERIES, "price")}
+
+    def trade(self, player_key: str, position: int) -> Tuple[int, int]:
+        return self.meta["epoch"], self.meta["leverage"][self.index[player_key]]
+
+    def trade_many(self, orders: List[Tuple[str, int]]) -> Tuple[int, List[Optional[int]]]:
+        leverage = self.meta["leverage"]
+        return self.meta["epoch"], [
+            None if (row := self.index.get(key)) is None else leverage[row] for key, _ in orders
+        ]
+
+
+class ArchivedGame:
+    """Stand-in for a finished GameEngine whose state lives in the on-disk archive."""
+
+    status: str = "done"
+
+    def __init__(self, path: str) -> None:
+        self.path: str = path
+        self.exchange: ArchivedExchange = ArchivedExchange(path)
+
+    @property
+    def timestep(self) -> int:
+        return self.exchange.meta["timestep"]
+
+    def start(self, player_keys: List[str]) -> None:
+        raise RuntimeError(
+            f"The game status must be 'waiting' to start. Current status: {self.status}"
+        )
+
+    def stop(self) -> None:
+        pass
+
+    def evict(self) -> None:
+        """Drop the metadata and feed read so far; the game is still served from disk."""
+        self.exchange = ArchivedExchange(self.path)
+
+
+class Archiver:
+    """Moves finished games out of a registry into memory-mapped archives."""
+
+    def __init__(self, directory: str, interval: float = 5.0) -> None:
+        self.directory: str = directory
+        self.interval: float = interval
+        os.makedirs(directory, exist_ok=True)
+
+    def archived_keys(self) -> List[str]:
+        return [
+            name[: -len(".json")]
+            for name in os.listdir(self.directory)
+            if name.endswith(".json") and ".tmp" not in name
+        ]
+
+    def load(self) -> Dict[str, ArchivedGame]:
+        """Register every archived game without opening its data."""
+        return {
+            key: ArchivedGame(os.path.join(self.directory, key)) for key in self.archived_keys()
+        }
+
+    def sweep(self, games: MutableMapping[str, Any]) -> None:
+        for game_key, engine in list(games.items()):
+            if isinstance(engine, GameEngine) and engine.status == "done":
+                try:
+                    write_archive(self.directory, game_key, engine)
+                except Exception:
+                    # The engine stays in memory and is retried on the next sweep
+                    metrics.increment("archive.errors")
+                    log.exception("Could not archive game %s", game_key)
+                    continue
+                games[game_key] = ArchivedGame(os.path.join(self.directory, game_key))
+
+    def watch(self, games: MutableMapping[str, Any]) -> None:
+        def run() -> None:
+            while True:
+                time.sleep(self.interval)
+                try:
+                    self.sweep(games)
+                except Exception:
+                    log.exception("Archive sweep failed")
+
+        threading.Thread(target=run, daemon=True).start()
@@ -0,0 +1,42 @@
+import threading
+import time
+from typing import Protocol
+
+
+class Clock(Protocol):
+    """Time source for the tick scheduler."""
+
+    def now(self) -> float: ...
+
+    def first_deadline(self, timestep: float) -> float: ...
+
+
+class MonotonicClock:
+    """Real time from the monotonic clock, which never jumps when the wall clock is corrected."""
+
+    def now(self) -> float:
+        return time.monotonic()
+
+    def first_deadline(self, timestep: float) -> float:
+        # Line the first tick up 0.1 s before a wall-clock multiple of the timestep, as clients
+        # expect; later deadlines are whole timesteps after it on the monotonic clock
+        wall = time.time()
+        return self.now() + ((timestep - 0.1) - wall % timestep) % timestep
+
+
+class VirtualClock:
+    """Clock that only moves when told to, for driving a scheduler without real sleeps."""
+
+    def __init__(self, start: float = 0.0) -> None:
+        self.time: float = start
+        self.lock: threading.Lock = threading.Lock()
+
+    def now(self) -> float:
+        return self.time
+
+    def first_deadline(self, timestep: float) -> float:
+        return self.time + timestep
+
+    def advance(self, seconds: float) -> None:
+        with self.lock:
+            self.time += seconds
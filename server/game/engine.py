@@ -1,28 +1,56 @@
 import threading
-import time
 from typing import List, Literal, Optional
 
 from game.exchange import Exchange
+from game.journal import GameJournal
 from game.market import Market
+from game.rng import new_seed, spawn_generators
+from game.scheduler import TickScheduler, scheduler as default_scheduler
 
 
 class GameEngine:
     """Orchestrates the game loop."""
 
-    def __init__(self, epochs: int, timestep: int) -> None:
+    def __init__(
+        self,
+        epochs: int,
+        timestep: int,
+        seed: Optional[int] = None,
+        journal: Optional[GameJournal] = None,
+        scheduler: Optional[TickScheduler] = None,
+    ) -> None:
         self.timestep: int = timestep
-        self.status: Literal["waiting", "running", "done", "stopped"] = "waiting"
-        self.thread: Optional[threading.Thread] = None
+        # The market noise is a function of the seed alone, so a game replays exactly
+        self.seed: int = seed if seed is not None else new_seed()
+        self.scheduler: TickScheduler = scheduler or default_scheduler
+        self.status: Literal["waiting", "running", "done", "stopped", "evicted"] = "waiting"
+        # Serializes status changes between the tick thread and stop/evict callers
+        self.status_lock: threading.Lock = threading.Lock()
 
-        market = Market(epochs)
+        market = Market(epochs, rng=spawn_generators(self.seed, 1)[0])
         self.exchange: Exchange = Exchange(market)
 
-    def run(self) -> None:
-        self.status = "running"
-        while self.exchange.market.epoch < self.exchange.market.epochs and self.status == "running":
-            time.sleep(((self.timestep - 0.1) - (time.time() % self.timestep)) % self.timestep)
+        self.journal: Optional[GameJournal] = None
+        if journal:
+            journal.create(epochs, timestep, self.seed)
+            self.attach_journal(journal)
+
+    def attach_journal(self, journal: GameJournal) -> None:
+        self.journal = journal
+        self.exchange.journal = journal
+
+    def tick(self) -> bool:
+        """Advance the market one epoch. Returns whether the engine should keep ticking."""
+        if self.status == "running":
             self.exchange.update_market()
-        self.status = "done"
+
+            if self.exchange.market.epoch >= self.exchange.market.epochs:
+                self._set_status("done", unless_changed_from="running")
+
+        if self.status != "running":
+            self.exchange.feed.close()
+            return False
+        return True
 
     def start(self, player_keys: List[str]) -> None:
         if self.status != "waiting":
@@ -30,14 +58,37 @@ class GameEngine:
                 f"The game status must be 'waiting' to start. Current status: {self.status}"
             )
 
-        for key in player_keys:
-            self.exchange.add_player_account(key)
+        if self.journal:
+            self.journal.start(list(player_keys))
+        self.exchange.add_player_accounts(player_keys)
+
+        if not self.scheduler.is_scheduled(self):
+            self.status = "running"
+            self.scheduler.add(self)
 
-        if not self.thread or not self.thread.is_alive():
-            self.thread = threading.Thread(target=self.run, daemon=True)
-            self.thread.start()
+    def _set_status(self, status: str, unless_changed_from: Optional[str] = None) -> str:
+        """
+        Set and journal the status, returning the previous one. With `unless_changed_from`,
+        only a status that still equals it is replaced.
+        """
+        with self.status_lock:
+            previous = self.status
+            if unless_changed_from is None or previous == unless_changed_from:
+                self.status = status  # type: ignore
+                if self.journal:
+                    self.journal.status(status)
+        return previous
 
     def stop(self) -> None:
-        self.status = "stopped"
-        if self.thread and self.thread.is_alive():
-            self.thread.join()
+        previous = self._set_status("stopped")
+        self.scheduler.remove(self)
+        # A game stopped while running ends as "done", as it did when each game had a thread
+        if previous == "running":
+            self._set_status("done", unless_changed_from="stopped")
+        self.exchange.feed.close()
+
+    def evict(self) -> None:
+        """Retire the engine for good. Recovery drops games journaled as evicted."""
+        self._set_status("evicted")
+        self.scheduler.remove(self)
+        self.exchange.feed.close()
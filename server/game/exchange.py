@@ -1,9 +1,39 @@
-import threading
-from typing import Any
+import time
+from typing import Any, ClassVar, Dict, Iterable, NamedTuple, Optional
 
 import numpy as np
 
+from game.feed import PriceFeed
+from game.journal import GameJournal
 from game.market import Market
+from game.metrics import TimedLock, metrics
+
+
+class PriceSnapshot(NamedTuple):
+    """Immutable (epoch, price) pair published once per settled epoch."""
+
+    epoch: int
+    price: float
+
+
+class AccountDtypes(NamedTuple):
+    """
+    Storage types of the per-player arrays. Position changes, holdings and leverage are
+    integers bounded by the leverage limit; metric is used for the portfolio values.
+    """
+
+    position: np.dtype
+    metric: np.dtype
+
+
+def account_dtypes(position: str = "int8", metric: str = "float64") -> AccountDtypes:
+    dtypes = AccountDtypes(np.dtype(position), np.dtype(metric))
+    # A trade may swing leverage from -10 to +10, so a position change needs to hold ±20
+    if dtypes.position.kind != "i":
+        raise ValueError(f"Position dtype must be a signed integer type, not {position}")
+    if dtypes.metric.kind != "f":
+        raise ValueError(f"Metric dtype must be a floating point type, not {metric}")
+    return dtypes
 
 
 class Exchange:
@@ -11,33 +41,175 @@ class Exchange:
     Manages interactions with the market.
     """
 
+    dtypes: ClassVar[AccountDtypes] = account_dtypes()
+
     def __init__(self, market: Market) -> None:
-        self.accounts: dict[str, dict[str, Any]] = {}
+        self.index: dict[str, int] = {}
+        self.positions: np.ndarray = np.zeros((0, market.epochs + 1), dtype=self.dtypes.position)
+        self.leverage: np.ndarray = np.zeros(0, dtype=self.dtypes.position)
         self.market: Market = market
         self.sum_log_return: float = 0
         self.start_price: float = 100
 
-        self.lock: threading.Lock = threading.Lock()
+        # Settled per-epoch holdings, portfolio values and prices, filled as epochs advance
+        self.holdings: np.ndarray = np.zeros((0, market.epochs + 1), dtype=self.dtypes.position)
+        self.portfolio: np.ndarray = np.zeros((0, market.epochs + 1), dtype=self.dtypes.metric)
+        self.log_value: np.ndarray = np.zeros(0, dtype=float)
+        self.prices: np.ndarray = np.zeros(market.epochs + 1, dtype=float)
+        self.prices[self.market.epoch] = self.start_price
 
-        self.market.reference_players(self.accounts)
+        self.lock: TimedLock = TimedLock(
+            metrics.histogram("exchange.lock_wait"), metrics.histogram("exchange.lock_hold")
+        )
+        self.feed: PriceFeed = PriceFeed()
+        self.snapshot: PriceSnapshot = PriceSnapshot(self.market.epoch, float(self.start_price))
+        self.journal: Optional[GameJournal] = None
+
+        self.market.reference_players(self.positions)
+        self.feed.publish(*self.snapshot)
 
     def add_player_account(self, player_key: str) -> None:
-        self.accounts[player_key] = {
-            "positions": np.zeros(self.market.epochs + 1, dtype=float),
-            "leverage": 0,
-        }
+        self.add_player_accounts([player_key])
+
+    def add_player_accounts(self, player_keys: Iterable[str]) -> None:
+        """
+        Open accounts for new players. The grown arrays are allocated without the lock, then
+        the existing rows are copied in and the arrays and index published together under it,
+        so trades see either the old accounts or all of the new ones.
+        """
+        new_keys = [key for key in dict.fromkeys(player_keys) if key not in self.index]
+        if not new_keys:
+            return
+
+        position, metric = self.dtypes
+        players = len(self.index) + len(new_keys)
+        shape = (players, self.market.epochs + 1)
+        positions = np.zeros(shape, dtype=position)
+        leverage = np.zeros(players, dtype=position)
+        holdings = np.zeros(shape, dtype=position)
+        portfolio = np.zeros(shape, dtype=metric)
+        log_value = np.zeros(players, dtype=float)
+
+        with self.lock:
+            rows = len(self.index)
+            index = dict(self.index)
+            for offset, key in enumerate(new_keys):
+                index[key] = rows + offset
+
+            positions[:rows] = self.positions
+            leverage[:rows] = self.leverage
+            holdings[:rows] = self.holdings
+            portfolio[:rows] = self.portfolio
+            portfolio[rows:, self.market.epoch] = self.start_price
+            log_value[:rows] = self.log_value
+
+            self.positions, self.leverage = positions, leverage
+            self.holdings, self.portfolio, self.log_value = holdings, portfolio, log_value
+            self.market.reference_players(self.positions)
+            self.index = index
 
     def update_market(self) -> None:
         with self.lock:
+            start = time.perf_counter()
             self.sum_log_return += self.market.update_state()
+            metrics.observe("market.update_state", time.perf_counter() - start)
+            epoch = self.market.epoch
+            self._settle(epoch)
+            # Swapping the reference is atomic, so readers never need the lock
+            self.snapshot = PriceSnapshot(epoch, float(self.prices[epoch]))
+            if self.journal:
+                self.journal.settle(epoch, self.market.state(epoch))
+        self.feed.publish(*self.snapshot)
 
-    def get_latest_price(self) -> tuple[int, float]:
+    def restore_epoch(self, epoch: int, values: list[float]) -> None:
+        """Re-apply a journaled epoch without drawing new market noise."""
+        with self.lock:
+            self.market.restore_state(epoch, values)
+            self.sum_log_return += self.market.log_return[epoch]
+            self._settle(epoch)
+            self.snapshot = PriceSnapshot(epoch, float(self.prices[epoch]))
+        self.feed.publish(*self.snapshot)
+
+    def restore_trade(self, epoch: int, player_key: str, position: int) -> None:
+        """Re-apply a journaled trade that was accepted during `epoch`."""
+        row = self.index[player_key]
         with self.lock:
-            return self.market.epoch, np.exp(self.sum_log_return) * self.start_price
+            self.positions[row, epoch + 1] = position
+            self.leverage[row] += position
+
+    def _settle(self, epoch: int) -> None:
+        """Roll holdings and portfolio values forward to the epoch that just closed."""
+        self.holdings[:, epoch] = self.holdings[:, epoch - 1] + self.positions[:, epoch]
+        self.log_value += self.holdings[:, epoch] * self.market.log_return[epoch]
+        self.portfolio[:, epoch] = self.start_price * np.exp(self.log_value)
+        self.prices[epoch] = np.exp(self.sum_log_return) * self.start_price
+
+    def get_latest_price(self) -> tuple[int, float]:
+        return self.snapshot
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the accounts, settled series and the market."""
+        return sum(self.memory().values())
+
+    def memory(self) -> Dict[str, int]:
+        """Bytes held per array, with the market's series counted together."""
+        arrays = ("positions", "leverage", "holdings", "portfolio", "log_value", "prices")
+        return {
+            **{name: getattr(self, name).nbytes for name in arrays},
+            "market": self.market.nbytes,
+        }
+
+    def get_scoreboard(self, since_epoch: int = 0) -> tuple[int, dict[str, Any]]:
+        """
+        Return the current epoch with views of the settled holdings, portfolios and prices
+        from `since_epoch` onwards, and the player index their rows belong to.
+        """
+        # New accounts publish their arrays before the index, so reading the index first
+        # never finds a row the arrays read after it lack
+        index = self.index
+        # Columns up to the published epoch are settled and never written again
+        epoch = self.snapshot.epoch
+        end = epoch + 1
+        start = min(since_epoch, end)
+        return epoch, {
+            "index": index,
+            "positions": self.holdings[:, start:end],
+            "portfolio": self.portfolio[:, start:end],
+            "price": self.prices[start:end],
+            "score": self.portfolio[:, epoch],
+        }
+
+    def get_replay(self, since_epoch: int = 0) -> tuple[int, dict[str, np.ndarray]]:
+        """Return the current epoch with views of the settled market series and prices."""
+        epoch = self.snapshot.epoch
+        end = epoch + 1
+        start = min(since_epoch, end)
+        series = {name: getattr(self.market, name)[start:end] for name in Market.SERIES}
+        return epoch, {**series, "price": self.prices[start:end]}
 
     def trade(self, player_key: str, position: int) -> tuple[int, int]:
+        row = self.index[player_key]
+        with self.lock:
+            return self.market.epoch, self._apply_trade(player_key, row, position)
+
+    def trade_many(self, orders: Iterable[tuple[str, int]]) -> tuple[int, list[Optional[int]]]:
+        """
+        Apply a batch of (player_key, position) orders under a single lock acquisition. The
+        leverage for an order is None when its player holds no account.
+        """
+        rows = [(key, self.index.get(key), position) for key, position in orders]
         with self.lock:
-            if abs(self.accounts[player_key]["leverage"] + position) <= 10:
-                self.accounts[player_key]["positions"][self.market.epoch + 1] = position
-                self.accounts[player_key]["leverage"] += position
-            return self.market.epoch, self.accounts[player_key]["leverage"]
+            return self.market.epoch, [
+                None if row is None else self._apply_trade(key, row, position)
+                for key, row, position in rows
+            ]
+
+    def _apply_trade(self, player_key: str, row: int, position: int) -> int:
+        # Compare as Python ints so an oversized order cannot overflow the compact dtype
+        if abs(int(self.leverage[row]) + position) <= 10:
+            self.positions[row, self.market.epoch + 1] = position
+            self.leverage[row] += position
+            if self.journal:
+                self.journal.trade(self.market.epoch, player_key, position)
+        return int(self.leverage[row])
@@ -0,0 +1,93 @@
+import asyncio
+import threading
+from typing import AsyncIterator, Callable, Iterator, Optional
+
+
+class PriceFeed:
+    """Broadcasts the latest (epoch, price) pair to any number of subscribers."""
+
+    def __init__(self) -> None:
+        self.condition: threading.Condition = threading.Condition()
+        self.latest: Optional[tuple[int, float]] = None
+        self.closed: bool = False
+        # One shared future per event loop wakes every async subscriber on that loop
+        self.wakeups: dict[asyncio.AbstractEventLoop, asyncio.Future] = {}
+        # Called with each (epoch, price) pair and with None on close, e.g. to forward them
+        self.listeners: list[Callable[[Optional[tuple[int, float]]], None]] = []
+
+    def publish(self, epoch: int, price: float) -> None:
+        with self.condition:
+            self.latest = (epoch, price)
+            self.condition.notify_all()
+            self._wake_loops()
+        for listener in self.listeners:
+            listener((epoch, price))
+
+    def close(self) -> None:
+        with self.condition:
+            self.closed = True
+            self.condition.notify_all()
+            self._wake_loops()
+        for listener in self.listeners:
+            listener(None)
+
+    def _wake_loops(self) -> None:
+        for loop, future in self.wakeups.items():
+            loop.call_soon_threadsafe(self._resolve, future)
+        self.wakeups.clear()
+
+    @staticmethod
+    def _resolve(future: asyncio.Future) -> None:
+        if not future.done():
+            future.set_result(None)
+
+    def subscribe(self, timeout: Optional[float] = None) -> Iterator[Optional[tuple[int, float]]]:
+        """
+        Yield each new (epoch, price) pair until the feed closes. Yields None when no new
+        epoch arrives within `timeout` seconds, so callers can send keep-alives.
+        """
+        last_epoch = -1
+
+        while True:
+            with self.condition:
+                self.condition.wait_for(
+                    lambda: (
+                        self.closed or (self.latest is not None and self.latest[0] > last_epoch)
+                    ),
+                    timeout,
+                )
+                latest, closed = self.latest, self.closed
+
+            if latest is not None and latest[0] > last_epoch:
+                last_epoch = latest[0]
+                yield latest
+            elif closed:
+                return
+            else:
+                yield None
+
+    async def subscribe_async(
+        self, timeout: Optional[float] = None
+    ) -> AsyncIterator[Optional[tuple[int, float]]]:
+        """Asyncio counterpart of `subscribe` that waits without holding a thread."""
+        loop = asyncio.get_running_loop()
+        last_epoch = -1
+
+        while True:
+            with self.condition:
+                latest, closed = self.latest, self.closed
+                fresh = latest is not None and latest[0] > last_epoch
+                if not fresh and not closed:
+                    if (future := self.wakeups.get(loop)) is None:
+                        future = self.wakeups[loop] = loop.create_future()
+
+            if fresh:
+                last_epoch = latest[0]  # type: ignore
+                yield latest
+            elif closed:
+                return
+            else:
+                try:
+                    await asyncio.wait_for(asyncio.shield(future), timeout)
+                except TimeoutError:
+                    yield None
@@ -0,0 +1,151 @@
+import atexit
+import json
+import logging
+import os
+import queue
+import threading
+from typing import Any, Container, Iterator, List, Optional
+
+from game.metrics import metrics
+
+log = logging.getLogger(__name__)
+
+
+class Journal:
+    """
+    Append-only log of game events. Callers only enqueue records; a background thread
+    writes everything queued since its last write as one batch and fsyncs once per batch.
+    """
+
+    # Seconds the interpreter waits at exit for queued records to reach the disk
+    close_timeout: float = 5.0
+
+    def __init__(self, path: str) -> None:
+        self.path: str = path
+        self.queue: queue.SimpleQueue = queue.SimpleQueue()
+        self.thread: Optional[threading.Thread] = None
+        self.lock: threading.Lock = threading.Lock()
+        self.error: Optional[BaseException] = None
+
+    def append(self, record: List[Any]) -> None:
+        # Once a write has failed the log is no longer trustworthy, so records are dropped
+        if self.error is not None:
+            return
+        if not self.thread:
+            self._start()
+        self.queue.put(record)
+
+    def _start(self) -> None:
+        with self.lock:
+            if not self.thread:
+                self.thread = threading.Thread(target=self.run, daemon=True)
+                self.thread.start()
+                atexit.register(self.close)
+
+    def _next_batch(self) -> List[Any]:
+        batch: List[Any] = [self.queue.get()]
+        while not self.queue.empty():
+            batch.append(self.queue.get())
+        return batch
+
+    @staticmethod
+    def _release(batch: List[Any]) -> None:
+        for record in batch:
+            if isinstance(record, threading.Event):
+                record.set()
+
+    def run(self) -> None:
+        batch: List[Any] = []
+        try:
+            with open(self.path, "a", encoding="utf-8") as file:
+                while True:
+                    batch = self._next_batch()
+                    lines = [json.dumps(record) for record in batch if isinstance(record, list)]
+                    if lines:
+                        file.write("\n".join(lines) + "\n")
+                        file.flush()
+                        os.fsync(file.fileno())
+                    self._release(batch)
+        except Exception as error:
+            self.error = error
+            metrics.increment("journal.errors")
+            log.exception("Journal %s failed, later records are dropped", self.path)
+
+        # Keep answering flushes so nothing waits on the dead log
+        while True:
+            self._release(batch)
+            batch = self._next_batch()
+
+    def flush(self, timeout: Optional[float] = None) -> None:
+        """Block until every record appended so far is on disk, or the log has failed."""
+        if self.thread:
+            event = threading.Event()
+            self.queue.put(event)
+            event.wait(timeout)
+
+    def close(self) -> None:
+        self.flush(self.close_timeout)
+
+    def read(self) -> Iterator[List[Any]]:
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, encoding="utf-8") as file:
+            for line in file:
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    # A torn final line from a crash mid-write
+                    return
+
+    def compact(self, keep: Container[str]) -> None:
+        """
+        Rewrite the log with only the records of the games in `keep` and swap it in
+        atomically, so finished, archived and evicted games stop being replayed. Only valid
+        before anything is appended, e.g. right after recovery.
+        """
+        with self.lock:
+            if self.thread:
+                raise RuntimeError("A journal can only be compacted before it is written to")
+            if not os.path.exists(self.path):
+                return
+
+            temp = f"{self.path}.compact"
+            try:
+                with open(temp, "w", encoding="utf-8") as file:
+                    for record in self.read():
+                        if record[1] in keep:
+                            file.write(json.dumps(record) + "\n")
+                    file.flush()
+                    os.fsync(file.fileno())
+                os.replace(temp, self.path)
+            except OSError:
+                # The uncompacted log is still complete, so recovery goes on without it
+                log.exception("Could not compact journal %s", self.path)
+                if os.path.exists(temp):
+                    os.remove(temp)
+
+    def game(self, game_key: str) -> "GameJournal":
+        return GameJournal(self, game_key)
+
+
+class GameJournal:
+    """Journal records for a single game."""
+
+    def __init__(self, journal: Journal, game_key: str) -> None:
+        self.journal: Journal = journal
+        self.game_key: str = game_key
+
+    def create(self, epochs: int, timestep: int, seed: int) -> None:
+        self.journal.append(["create", self.game_key, epochs, timestep, seed])
+
+    def start(self, player_keys: List[str]) -> None:
+        self.journal.append(["start", self.game_key, player_keys])
+
+    def status(self, status: str) -> None:
+        self.journal.append(["status", self.game_key, status])
+
+    def trade(self, epoch: int, player_key: str, position: int) -> None:
+        self.journal.append(["trade", self.game_key, epoch, player_key, position])
+
+    def settle(self, epoch: int, values: List[float]) -> None:
+        self.journal.append(["epoch", self.game_key, epoch, values])
@@ -1,18 +1,46 @@
-from typing import Any, Dict
+from typing import Literal, Optional
+
 import numpy as np
 
+from game.quantile import make_quantile
+
+# Standard-normal draws made at a time; each epoch only scales its own draw
+NOISE_BLOCK = 64
+
 
 class Market:
     """Simulates price movements in a financial market."""
 
-    def __init__(self, epochs: int, volatility: float = 0.01, decay: float = 0.7) -> None:
+    SERIES = (
+        "log_return",
+        "trading_volume",
+        "order_flow",
+        "jitter",
+        "surge",
+        "dispersion",
+        "sentiment",
+    )
+
+    def __init__(
+        self,
+        epochs: int,
+        volatility: float = 0.01,
+        decay: float = 0.7,
+        quantile: Literal["exact", "p2"] = "exact",
+        rng: Optional[np.random.Generator] = None,
+    ) -> None:
         self.epoch: int = 0
         self.epochs: int = epochs
-        self.accounts: Dict[str, Dict[str, Any]]
+        self.positions: np.ndarray
         self.log_return: np.ndarray = np.empty(epochs + 1, dtype=float)
 
         self.volatility = volatility
         self.decay = decay
+        self.volume_quantile = make_quantile(0.9, quantile)
+        # Unseeded markets still get a private stream rather than the global one
+        self.rng: np.random.Generator = rng if rng is not None else np.random.default_rng()
+        self.noise: np.ndarray = np.empty(0)
+        self.noise_end: int = 0
 
         self.trading_volume = np.empty(epochs + 1, dtype=float)
         self.order_flow = np.empty(epochs + 1, dtype=float)
@@ -29,25 +57,39 @@ class Market:
         self.sentiment[self.epoch] = 0.0
         self.log_return[self.epoch] = 0.0
 
-    def reference_players(self, accounts: Dict[str, Dict[str, Any]]) -> None:
-        self.accounts = accounts
+    def reference_players(self, positions: np.ndarray) -> None:
+        self.positions = positions
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the market series, excluding the referenced player positions."""
+        return self.noise.nbytes + sum(getattr(self, name).nbytes for name in self.SERIES)
+
+    def draw_noise(self, epoch: int) -> float:
+        """
+        Standard-normal noise for `epoch`, drawn NOISE_BLOCK epochs at a time. The stream is
+        the same however it is blocked, so draws also line up after recovery skips epochs.
+        """
+        while epoch >= self.noise_end:
+            self.noise = self.rng.standard_normal(NOISE_BLOCK)
+            self.noise_end += NOISE_BLOCK
+        return float(self.noise[epoch - self.noise_end + NOISE_BLOCK])
 
     def update_state(self) -> float:
         # Compute trading volume
-        buy_volume, sell_volume = 0, 0
-        for account in self.accounts.values():
-            position = account["positions"][self.epoch]
-            buy_volume += position
-            sell_volume -= position
+        buy_volume = self.positions[:, self.epoch].sum()
+        sell_volume = -buy_volume
 
         # calculate market metrics
         trading_volume = buy_volume + sell_volume
         order_flow = buy_volume - sell_volume
 
-        # calculate percentile of trading volume
-        current_tv = self.trading_volume[: self.epoch]
-        nonzero_tv = current_tv[current_tv != 0]
-        volume_percentile = np.percentile(nonzero_tv, 90) if nonzero_tv.size >= 3 else np.inf
+        # calculate percentile of trading volume, excluding the latest epoch
+        if self.epoch > 0 and self.trading_volume[self.epoch - 1] != 0:
+            self.volume_quantile.add(self.trading_volume[self.epoch - 1])
+        volume_percentile = (
+            self.volume_quantile.value() if len(self.volume_quantile) >= 3 else np.inf
+        )
 
         # calculate market ratios
         trading_volume_ratio = np.minimum(trading_volume / volume_percentile, 1)
@@ -62,7 +104,7 @@ class Market:
         sentiment = self.sentiment[self.epoch] * self.decay + surge * (1 - self.decay)
 
         # simulate price
-        log_return = np.random.normal(surge + sentiment, jitter + dispersion)
+        log_return = (surge + sentiment) + (jitter + dispersion) * self.draw_noise(self.epoch)
 
         # Update market state
         self.epoch += 1
@@ -75,3 +117,16 @@ class Market:
         self.log_return[self.epoch] = log_return
 
         return self.log_return[self.epoch]
+
+    def state(self, epoch: int) -> list[float]:
+        """Return the value of every series at `epoch`, in SERIES order."""
+        return [float(getattr(self, name)[epoch]) for name in self.SERIES]
+
+    def restore_state(self, epoch: int, values: list[float]) -> None:
+        """Replay a settled epoch recorded with `state`, as if update_state had produced it."""
+        if epoch > 1 and self.trading_volume[epoch - 2] != 0:
+            self.volume_quantile.add(self.trading_volume[epoch - 2])
+
+        for name, value in zip(self.SERIES, values):
+            getattr(self, name)[epoch] = value
+        self.epoch = epoch
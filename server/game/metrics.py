@@ -0,0 +1,114 @@
+import bisect
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+# Bucket upper bounds in seconds, doubling from 1 µs to about 16 s
+BOUNDS: List[float] = [1e-6 * 2**i for i in range(25)]
+
+
+class Histogram:
+    """Latency histogram over fixed, exponentially sized buckets."""
+
+    def __init__(self) -> None:
+        self.lock: threading.Lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self.lock:
+            self.counts: List[int] = [0] * (len(BOUNDS) + 1)
+            self.count: int = 0
+            self.total: float = 0.0
+            self.max: float = 0.0
+
+    def observe(self, seconds: float) -> None:
+        i = bisect.bisect_left(BOUNDS, seconds)
+        with self.lock:
+            self.counts[i] += 1
+            self.count += 1
+            self.total += seconds
+            if seconds > self.max:
+                self.max = seconds
+
+    def quantile(self, q: float) -> float:
+        """Upper bound of the bucket holding the q-quantile, capped at the observed max."""
+        rank, seen = q * self.count, 0
+        for i, count in enumerate(self.counts):
+            seen += count
+            if count and seen >= rank:
+                return min(BOUNDS[i], self.max) if i < len(BOUNDS) else self.max
+        return 0.0
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self.lock:
+            return {
+                "count": self.count,
+                "mean": self.total / self.count if self.count else 0.0,
+                "p50": self.quantile(0.5),
+                "p90": self.quantile(0.9),
+                "p99": self.quantile(0.99),
+                "max": self.max,
+            }
+
+
+class Metrics:
+    """Named histograms and counters, created on first use."""
+
+    def __init__(self) -> None:
+        self.histograms: Dict[str, Histogram] = {}
+        self.counters: Dict[str, int] = {}
+        self.lock: threading.Lock = threading.Lock()
+
+    def histogram(self, name: str) -> Histogram:
+        if (histogram := self.histograms.get(name)) is None:
+            with self.lock:
+                histogram = self.histograms.setdefault(name, Histogram())
+        return histogram
+
+    def observe(self, name: str, seconds: float) -> None:
+        self.histogram(name).observe(seconds)
+
+    def increment(self, name: str, count: int = 1) -> None:
+        with self.lock:
+            self.counters[name] = self.counters.get(name, 0) + count
+
+    def snapshot(self) -> Dict[str, Any]:
+        histograms = {
+            name: histogram.snapshot() for name, histogram in list(self.histograms.items())
+        }
+        with self.lock:
+            counters = dict(self.counters)
+        return dict(sorted({**histograms, **counters}.items()))
+
+    def reset(self) -> None:
+        # Histograms are cleared in place, as instrumented objects hold references to them
+        for histogram in list(self.histograms.values()):
+            histogram.reset()
+        with self.lock:
+            self.counters = {}
+
+
+class TimedLock:
+    """Lock that records how long callers wait to acquire it and how long they hold it."""
+
+    def __init__(self, wait: Histogram, hold: Histogram) -> None:
+        self.lock: threading.Lock = threading.Lock()
+        self.wait: Histogram = wait
+        self.hold: Histogram = hold
+        self.acquired: Optional[float] = None
+
+    def __enter__(self) -> "TimedLock":
+        start = time.perf_counter()
+        self.lock.acquire()
+        # Only the holder writes this, so it needs no further synchronisation
+        self.acquired = time.perf_counter()
+        self.wait.observe(self.acquired - start)
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        held = time.perf_counter() - self.acquired  # type: ignore
+        self.lock.release()
+        self.hold.observe(held)
+
+
+metrics = Metrics()
@@ -0,0 +1,110 @@
+import bisect
+import math
+from typing import List, Literal
+
+
+class ExactQuantile:
+    """
+    Tracks an exact quantile over a growing sample using a sorted buffer. Reads are O(1);
+    insort finds the slot by binary search but the list insert itself is O(n), which stays
+    cheap at game lengths because it is a single memmove.
+    """
+
+    def __init__(self, q: float) -> None:
+        self.q: float = q
+        self.values: List[float] = []
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def add(self, value: float) -> None:
+        bisect.insort(self.values, value)
+
+    def value(self) -> float:
+        """Return the quantile using the same linear interpolation as np.percentile."""
+        n = len(self.values)
+        virtual_index = (n - 1) * self.q
+        lower = math.floor(virtual_index)
+        upper = min(lower + 1, n - 1)
+        gamma = virtual_index - lower
+
+        below, above = self.values[lower], self.values[upper]
+        diff = above - below
+        if gamma >= 0.5:
+            return above - diff * (1 - gamma)
+        return below + diff * gamma
+
+
+class P2Quantile:
+    """Approximates a quantile in constant memory with the P² algorithm (Jain & Chlamtac)."""
+
+    def __init__(self, q: float) -> None:
+        self.q: float = q
+        self.count: int = 0
+        self.heights: List[float] = []
+        self.positions: List[float] = [1, 2, 3, 4, 5]
+        self.desired: List[float] = [1, 1 + 2 * q, 1 + 4 * q, 3 + 2 * q, 5]
+        self.increments: List[float] = [0, q / 2, q, (1 + q) / 2, 1]
+
+    def __len__(self) -> int:
+        return self.count
+
+    def add(self, value: float) -> None:
+        self.count += 1
+
+        if self.count <= 5:
+            bisect.insort(self.heights, value)
+            return
+
+        h = self.heights
+        if value < h[0]:
+            h[0] = value
+            k = 0
+        elif value >= h[4]:
+            h[4] = value
+            k = 3
+        else:
+            k = bisect.bisect_right(h, value) - 1
+
+        for i in range(k + 1, 5):
+            self.positions[i] += 1
+        for i in range(5):
+            self.desired[i] += self.increments[i]
+
+        for i in range(1, 4):
+            d = self.desired[i] - self.positions[i]
+            if (d >= 1 and self.positions[i + 1] - self.positions[i] > 1) or (
+                d <= -1 and self.positions[i - 1] - self.positions[i] < -1
+            ):
+                step = 1 if d > 0 else -1
+                height = self._parabolic(i, step)
+                if not h[i - 1] < height < h[i + 1]:
+                    height = self._linear(i, step)
+                h[i] = height
+                self.positions[i] += step
+
+    def _parabolic(self, i: int, step: int) -> float:
+        h, n = self.heights, self.positions
+        return h[i] + step / (n[i + 1] - n[i - 1]) * (
+            (n[i] - n[i - 1] + step) * (h[i + 1] - h[i]) / (n[i + 1] - n[i])
+            + (n[i + 1] - n[i] - step) * (h[i] - h[i - 1]) / (n[i] - n[i - 1])
+        )
+
+    def _linear(self, i: int, step: int) -> float:
+        h, n = self.heights, self.positions
+        return h[i] + step * (h[i + step] - h[i]) / (n[i + step] - n[i])
+
+    def value(self) -> float:
+        if self.count <= 5:
+            exact = ExactQuantile(self.q)
+            exact.values = self.heights
+            return exact.value()
+        return self.heights[2]
+
+
+def make_quantile(q: float, mode: Literal["exact", "p2"]) -> ExactQuantile | P2Quantile:
+    if mode == "exact":
+        return ExactQuantile(q)
+    if mode == "p2":
+        return P2Quantile(q)
+    raise ValueError(f"Unknown quantile mode: {mode}")
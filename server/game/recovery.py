@@ -0,0 +1,55 @@
+from typing import Container, Dict
+
+from game.engine import GameEngine
+from game.journal import Journal
+
+
+def recover(journal: Journal, exclude: Container[str] = ()) -> Dict[str, GameEngine]:
+    """
+    Rebuild every journaled game and resume the ones that were still running. Games in
+    `exclude`, such as those already archived, are skipped. The journal is then compacted
+    to the games that were rebuilt, so it only grows with games since the last start.
+    """
+    engines: Dict[str, GameEngine] = {}
+
+    for kind, game_key, *args in journal.read():
+        if kind == "create":
+            if game_key in exclude:
+                continue
+            engines[game_key] = GameEngine(*args)
+            continue
+
+        engine = engines.get(game_key)
+        if engine is None:
+            continue
+
+        if kind == "start":
+            engine.exchange.add_player_accounts(args[0])
+            engine.status = "running"
+        elif kind == "trade":
+            engine.exchange.restore_trade(*args)
+        elif kind == "epoch":
+            engine.exchange.restore_epoch(*args)
+        elif kind == "status":
+            engine.status = args[0]
+
+    for game_key, engine in list(engines.items()):
+        if engine.status == "evicted":
+            del engines[game_key]
+
+    # Before any engine resumes, as compaction must finish before new records are appended
+    journal.compact(engines)
+
+    for game_key, engine in engines.items():
+        engine.attach_journal(journal.game(game_key))
+
+        market = engine.exchange.market
+        if engine.status == "running" and market.epoch >= market.epochs:
+            engine.status = "done"
+
+        if engine.status == "running":
+            engine.scheduler.add(engine)
+        elif engine.status != "waiting":
+            engine.exchange.feed.close()
+
+    return engines
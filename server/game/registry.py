@@ -0,0 +1,145 @@
+import threading
+import time
+from typing import Any, Callable, Dict, ItemsView, Iterator, List, MutableMapping, Optional
+
+from game.archive import ArchivedGame
+from game.engine import GameEngine
+
+
+class GameRegistry(MutableMapping[str, Any]):
+    """
+    Game registry that evicts in-memory engines which are not running: any idle for longer
+    than `ttl` seconds, then the least recently used while the engines exceed `memory_budget`
+    bytes. A ttl or budget of 0 disables that limit. Running games are never evicted.
+
+    Archived games stay registered, as they are served from disk; one idle for longer than
+    `ttl` only drops what it has cached, and the `on_evict` callbacks fire for it all the same.
+    """
+
+    def __init__(self, ttl: float = 0, memory_budget: int = 0) -> None:
+        self.ttl: float = ttl
+        self.memory_budget: int = memory_budget
+        self.engines: Dict[str, Any] = {}
+        self.last_access: Dict[str, float] = {}
+        self.evicted: int = 0
+        self.on_evict: List[Callable[[str], None]] = []
+        self.lock: threading.Lock = threading.Lock()
+
+    def __getitem__(self, game_key: str) -> Any:
+        engine = self.engines[game_key]
+        self.last_access[game_key] = time.monotonic()
+        return engine
+
+    def __setitem__(self, game_key: str, engine: Any) -> None:
+        self.engines[game_key] = engine
+        self.last_access[game_key] = time.monotonic()
+
+    def __delitem__(self, game_key: str) -> None:
+        del self.engines[game_key]
+        self.last_access.pop(game_key, None)
+
+    def __contains__(self, game_key: object) -> bool:
+        return game_key in self.engines
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self.engines))
+
+    def __len__(self) -> int:
+        return len(self.engines)
+
+    def items(self) -> ItemsView[str, Any]:
+        # Sweeps iterate without counting as an access
+        return self.engines.items()
+
+    def nbytes(self) -> int:
+        return sum(
+            engine.exchange.nbytes
+            for engine in list(self.engines.values())
+            if isinstance(engine, GameEngine)
+        )
+
+    def sweep(self) -> List[str]:
+        """Evict stale engines, returning their keys."""
+        now = time.monotonic()
+
+        with self.lock:
+            idle = sorted(
+                (self.last_access.get(key, now), key, engine)
+                for key, engine in list(self.engines.items())
+                if isinstance(engine, GameEngine) and engine.status != "running"
+            )
+
+            evict = {key for accessed, key, _ in idle if self.ttl and now - accessed > self.ttl}
+
+            if self.memory_budget:
+                excess = self.nbytes() - self.memory_budget
+                for _, key, engine in idle:
+                    if excess <= 0:
+                        break
+                    if key not in evict:
+                        evict.add(key)
+                        excess -= engine.exchange.nbytes
+
+            for key in evict:
+                self._evict(key)
+
+            if self.ttl:
+                for key, engine in list(self.engines.items()):
+                    accessed = self.last_access.get(key, now)
+                    if isinstance(engine, ArchivedGame) and now - accessed > self.ttl:
+                        self._release(key, engine)
+
+        return sorted(evict)
+
+    def _release(self, game_key: str, game: ArchivedGame) -> None:
+        # Forgetting the access time keeps the game out of later sweeps until it is read again
+        self.last_access.pop(game_key, None)
+        game.evict()
+        for callback in self.on_evict:
+            callback(game_key)
+
+    def _evict(self, game_key: str) -> None:
+        engine = self.engines.pop(game_key, None)
+        self.last_access.pop(game_key, None)
+        if engine is None:
+            return
+
+        engine.evict()
+        self.evicted += 1
+        for callback in self.on_evict:
+            callback(game_key)
+
+    def stats(self) -> Dict[str, Any]:
+        statuses: Dict[str, int] = {}
+        memory: Dict[str, int] = {}
+        players = 0
+        for engine in list(self.engines.values()):
+            statuses[engine.status] = statuses.get(engine.status, 0) + 1
+            if isinstance(engine, GameEngine):
+                players += len(engine.exchange.index)
+                for name, size in engine.exchange.memory().items():
+                    memory[name] = memory.get(name, 0) + size
+
+        return {
+            "games": len(self.engines),
+            "statuses": statuses,
+            "memory_bytes": self.nbytes(),
+            "memory_by_array": memory,
+            "players": players,
+            "memory_budget": self.memory_budget,
+            "ttl": self.ttl,
+            "evicted": self.evicted,
+        }
+
+    def watch(self, interval: Optional[float] = None) -> None:
+        """Sweep from a daemon thread every `interval` seconds."""
+        if not (self.ttl or self.memory_budget):
+            return
+        interval = interval or min(self.ttl or 60, 60)
+
+        def run() -> None:
+            while True:
+                time.sleep(interval)
+                self.sweep()
+
+        threading.Thread(target=run, daemon=True).start()
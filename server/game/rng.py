@@ -0,0 +1,17 @@
+from typing import List, Optional
+
+import numpy as np
+
+
+def new_seed() -> int:
+    """Fresh entropy for a game seed, kept below 2**63 so it fits a signed 64-bit column."""
+    return int(np.random.SeedSequence().generate_state(1, np.uint64)[0] >> 1)
+
+
+def spawn_generators(seed: Optional[int], markets: int) -> List[np.random.Generator]:
+    """
+    Spawn one independent generator per market. Market i of a simulation replays exactly in
+    a single Market built with `rng=spawn_generators(seed, markets)[i]`.
+    """
+    children = np.random.SeedSequence(seed).spawn(markets)
+    return [np.random.Generator(np.random.PCG64(child)) for child in children]
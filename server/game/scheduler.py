@@ -0,0 +1,127 @@
+import heapq
+import itertools
+import math
+import threading
+import traceback
+from typing import Literal, Optional, Protocol
+
+from game.clock import Clock, MonotonicClock
+from game.metrics import metrics
+
+
+class Tickable(Protocol):
+    timestep: int
+
+    def tick(self) -> bool: ...
+
+
+class TickScheduler:
+    """
+    Ticks every running engine from a single thread, ordered by deadline in a heap.
+
+    The n-th tick of an engine is due at `origin + n * timestep` on `clock`, so slow ticks
+    never push later deadlines back. When the loop falls a whole timestep or more behind,
+    the `catch_up` policy ticks the overdue epochs back to back, while `skip` drops them and
+    resumes at the next deadline. Either way the overdue epochs are counted in the
+    `tick.caught_up` or `tick.missed` metric.
+
+    With `background=False` no thread is started and the owner calls `run_pending`, which
+    together with a VirtualClock drives engines without real sleeps.
+    """
+
+    def __init__(
+        self,
+        clock: Optional[Clock] = None,
+        policy: Literal["catch_up", "skip"] = "catch_up",
+        background: bool = True,
+    ) -> None:
+        self.clock: Clock = clock or MonotonicClock()
+        self.policy: Literal["catch_up", "skip"] = policy
+        self.background: bool = background
+        # (deadline, seq, engine, origin, tick number)
+        self.heap: list[tuple[float, int, Tickable, float, int]] = []
+        self.counter = itertools.count()
+        self.active: set[int] = set()
+        self.ticking: set[int] = set()
+        self.condition: threading.Condition = threading.Condition()
+        self.thread: threading.Thread | None = None
+
+    def add(self, engine: Tickable) -> None:
+        origin = self.clock.first_deadline(engine.timestep)
+
+        with self.condition:
+            self.active.add(id(engine))
+            heapq.heappush(self.heap, (origin, next(self.counter), engine, origin, 0))
+            self.condition.notify()
+
+            if self.background and (not self.thread or not self.thread.is_alive()):
+                self.thread = threading.Thread(target=self.run, daemon=True)
+                self.thread.start()
+
+    def remove(self, engine: Tickable) -> None:
+        """Stop ticking the engine, waiting for an in-flight tick to finish."""
+        with self.condition:
+            self.active.discard(id(engine))
+            self.condition.wait_for(lambda: id(engine) not in self.ticking)
+
+    def is_scheduled(self, engine: Tickable) -> bool:
+        return id(engine) in self.active
+
+    def run(self) -> None:
+        while True:
+            with self.condition:
+                while not self.heap or self.heap[0][0] > self.clock.now():
+                    timeout = self.heap[0][0] - self.clock.now() if self.heap else None
+                    self.condition.wait(timeout)
+
+            self.run_pending()
+
+    def run_pending(self) -> int:
+        """Tick every engine whose deadline has passed, returning the number of ticks."""
+        with self.condition:
+            now = self.clock.now()
+            due: list[tuple[float, Tickable, float, int]] = []
+            while self.heap and self.heap[0][0] <= now:
+                deadline, _, engine, origin, n = heapq.heappop(self.heap)
+                if id(engine) in self.active:
+                    due.append((deadline, engine, origin, n))
+                    self.ticking.add(id(engine))
+
+        for deadline, engine, origin, n in due:
+            start = self.clock.now()
+            # How late the tick fires; grows when the loop falls behind
+            metrics.observe("tick.jitter", start - deadline)
+            try:
+                keep = engine.tick()
+            except Exception:
+                traceback.print_exc()
+                keep = False
+            metrics.observe("tick.duration", self.clock.now() - start)
+
+            with self.condition:
+                self.ticking.discard(id(engine))
+                if keep and id(engine) in self.active:
+                    n = self._next_tick(engine, origin, n)
+                    deadline = origin + n * engine.timestep
+                    heapq.heappush(self.heap, (deadline, next(self.counter), engine, origin, n))
+                else:
+                    self.active.discard(id(engine))
+                self.condition.notify_all()
+
+        return len(due)
+
+    def _next_tick(self, engine: Tickable, origin: float, n: int) -> int:
+        # Ticks whose deadline has already passed are overdue
+        due = math.floor((self.clock.now() - origin) / engine.timestep) + 1
+        overdue = due - (n + 1)
+        if overdue <= 0:
+            return n + 1
+
+        if self.policy == "skip":
+            metrics.increment("tick.missed", overdue)
+            return due
+        metrics.increment("tick.caught_up")
+        return n + 1
+
+
+scheduler = TickScheduler()
@@ -0,0 +1,363 @@
+import bisect
+import hashlib
+import multiprocessing
+import threading
+from multiprocessing.connection import Connection
+from typing import Any, Dict, Iterator, List, MutableMapping, Optional, Tuple
+
+from game.archive import Archiver
+from game.engine import GameEngine
+from game.exchange import AccountDtypes, Exchange
+from game.feed import PriceFeed
+from game.journal import Journal
+from game.metrics import metrics
+from game.recovery import recover
+from game.registry import GameRegistry
+from game.scheduler import scheduler
+
+
+def _hash(value: str) -> int:
+    return int.from_bytes(hashlib.blake2b(value.encode(), digest_size=8).digest(), "big")
+
+
+class HashRing:
+    """Consistent hash ring mapping game keys to shard indices."""
+
+    def __init__(self, shards: int, replicas: int = 64) -> None:
+        points = sorted(
+            (_hash(f"{shard}:{replica}"), shard)
+            for shard in range(shards)
+            for replica in range(replicas)
+        )
+        self.hashes: List[int] = [point for point, _ in points]
+        self.shards: List[int] = [shard for _, shard in points]
+
+    def shard_for(self, key: str) -> int:
+        i = bisect.bisect(self.hashes, _hash(key)) % len(self.hashes)
+        return self.shards[i]
+
+
+def serve(
+    conn: Connection,
+    updates: Connection,
+    journal_path: Optional[str],
+    archive_dir: Optional[str],
+    limits: Tuple[float, int] = (0, 0),
+    policy: str = "catch_up",
+    dtypes: Optional[AccountDtypes] = None,
+) -> None:
+    """
+    Worker process loop: own the engines of one shard and answer calls from the server.
+    Every price a game publishes, and its close, is pushed to the server over `updates`.
+    """
+    # Spawned workers start from a fresh interpreter, so the app's settings are passed in
+    scheduler.policy = policy
+    if dtypes:
+        Exchange.dtypes = dtypes
+
+    journal = Journal(journal_path) if journal_path else None
+    archiver = Archiver(archive_dir) if archive_dir else None
+    engines = GameRegistry(*limits)
+    send_lock = threading.Lock()
+
+    def push(game_key: str, engine: Any) -> None:
+        def forward(update: Optional[Tuple[int, float]]) -> None:
+            with send_lock:
+                updates.send((game_key, update))
+
+        engine.exchange.feed.listeners.append(forward)
+
+    if archiver:
+        engines.update(archiver.load())
+        archiver.watch(engines)
+
+    if journal:
+        engines.update(recover(journal, exclude=engines))
+
+    for game_key, engine in engines.items():
+        push(game_key, engine)
+
+    engines.watch()
+
+    while True:
+        try:
+            game_key, target, name, args = conn.recv()
+        except EOFError:
+            return
+
+        try:
+            if target == "registry":
+                if name == "create":
+                    engine = GameEngine(*args, journal=journal.game(game_key) if journal else None)
+                    push(game_key, engine)
+                    engines[game_key] = engine
+                    result = None
+                elif name == "delete":
+                    engines.pop(game_key).stop()
+                    result = None
+                elif name == "contains":
+                    result = game_key in engines
+                elif name == "keys":
+                    result = list(engines)
+                elif name == "stats":
+                    result = engines.stats()
+                elif name == "metrics":
+                    result = metrics.snapshot()
+                else:
+                    raise ValueError(f"Unknown registry call: {name}")
+            else:
+                obj = engines[game_key] if target == "engine" else engines[game_key].exchange
+                attr = getattr(obj, name)
+                result = attr(*args) if callable(attr) else attr
+            conn.send((True, result))
+        except Exception as error:
+            conn.send((False, error))
+
+
+class Shard:
+    """
+    A worker process, the pipe used to call into it and the pipe it pushes prices over.
+    Pushed prices are fanned out to one local PriceFeed per game, so any number of
+    subscribers follow a sharded game without calling into the worker.
+    """
+
+    def __init__(
+        self,
+        context: Any,
+        index: int,
+        journal_path: Optional[str] = None,
+        archive_dir: Optional[str] = None,
+        limits: Tuple[float, int] = (0, 0),
+        policy: str = "catch_up",
+        dtypes: Optional[AccountDtypes] = None,
+    ) -> None:
+        self.conn, child = context.Pipe()
+        self.updates, child_updates = context.Pipe(duplex=False)
+        journal = f"{journal_path}.{index}" if journal_path else None
+        self.process = context.Process(
+            target=serve,
+            args=(child, child_updates, journal, archive_dir, limits, policy, dtypes),
+            name=f"game-shard-{index}",
+            daemon=True,
+        )
+        self.process.start()
+        child.close()
+        child_updates.close()
+        self.lock: threading.Lock = threading.Lock()
+
+        self.feeds: Dict[str, PriceFeed] = {}
+        self.feeds_lock: threading.Lock = threading.Lock()
+        threading.Thread(
+            target=self._fan_out, name=f"game-shard-{index}-feeds", daemon=True
+        ).start()
+
+    def call(self, game_key: Optional[str], target: str, name: str, *args: Any) -> Any:
+        with self.lock:
+            self.conn.send((game_key, target, name, args))
+            ok, result = self.conn.recv()
+        if not ok:
+            raise result
+        return result
+
+    def _fan_out(self) -> None:
+        """Publish the prices pushed by the worker to the local feeds of their games."""
+        while True:
+            try:
+                game_key, update = self.updates.recv()
+            except EOFError:
+                return
+
+            with self.feeds_lock:
+                feed = self.feeds.get(game_key)
+                if feed is not None and update is None:
+                    del self.feeds[game_key]
+
+            if feed is None:
+                continue
+            if update is None:
+                feed.close()
+            else:
+                feed.publish(*update)
+
+    def feed(self, game_key: str) -> PriceFeed:
+        """The local feed of a game, created and brought up to date on first use."""
+        with self.feeds_lock:
+            if (feed := self.feeds.get(game_key)) is not None:
+                return feed
+            feed = self.feeds[game_key] = PriceFeed()
+
+        # Pushes reach the feed from now on; catch up on what was published before
+        try:
+            epoch, price = self.call(game_key, "exchange", "get_latest_price")
+            status = self.call(game_key, "engine", "status")
+        except Exception:
+            with self.feeds_lock:
+                self.feeds.pop(game_key, None)
+            raise
+
+        with feed.condition:
+            if feed.latest is None or feed.latest[0] < epoch:
+                feed.publish(epoch, price)
+        if status not in ("waiting", "running"):
+            with self.feeds_lock:
+                if self.feeds.get(game_key) is feed:
+                    del self.feeds[game_key]
+            feed.close()
+        return feed
+
+
+class RemoteExchange:
+    """Proxy for the Exchange of a game that lives in a shard."""
+
+    def __init__(self, shard: Shard, game_key: str) -> None:
+        self.shard = shard
+        self.game_key = game_key
+
+    @property
+    def feed(self) -> PriceFeed:
+        return self.shard.feed(self.game_key)
+
+    @property
+    def index(self) -> Dict[str, int]:
+        return self.shard.call(self.game_key, "exchange", "index")
+
+    @property
+    def start_price(self) -> float:
+        return self.shard.call(self.game_key, "exchange", "start_price")
+
+    def get_latest_price(self) -> Tuple[int, float]:
+        return self.shard.call(self.game_key, "exchange", "get_latest_price")
+
+    def get_scoreboard(self, since_epoch: int = 0) -> Tuple[int, Dict[str, Any]]:
+        return self.shard.call(self.game_key, "exchange", "get_scoreboard", since_epoch)
+
+    def get_replay(self, since_epoch: int = 0) -> Tuple[int, Dict[str, Any]]:
+        return self.shard.call(self.game_key, "exchange", "get_replay", since_epoch)
+
+    def trade(self, player_key: str, position: int) -> Tuple[int, int]:
+        return self.shard.call(self.game_key, "exchange", "trade", player_key, position)
+
+    def trade_many(self, orders: List[Tuple[str, int]]) -> Tuple[int, List[Optional[int]]]:
+        return self.shard.call(self.game_key, "exchange", "trade_many", orders)
+
+
+class RemoteEngine:
+    """Proxy with the GameEngine interface the routes use, for a game that lives in a shard."""
+
+    def __init__(self, shard: Shard, game_key: str) -> None:
+        self.shard = shard
+        self.game_key = game_key
+        self.exchange = RemoteExchange(shard, game_key)
+
+    @property
+    def status(self) -> str:
+        return self.shard.call(self.game_key, "engine", "status")
+
+    @property
+    def timestep(self) -> int:
+        return self.shard.call(self.game_key, "engine", "timestep")
+
+    def start(self, player_keys: List[str]) -> None:
+        self.shard.call(self.game_key, "engine", "start", player_keys)
+
+    def stop(self) -> None:
+        self.shard.call(self.game_key, "engine", "stop")
+
+
+class ShardedGames(MutableMapping[str, Any]):
+    """
+    Game registry that spreads engines over worker processes by consistent hashing of the
+    game key. Assigning an engine recreates it in the owning shard from its configuration.
+    Each shard journals to `<journal_path>.<index>`, so a restart with the same shard count
+    recovers every game in its owner. Shards share `archive_dir`, as game keys are unique,
+    and each applies the (ttl, memory budget) `limits` to its own games. The tick `policy`
+    and account `dtypes` are handed to the workers, which do not run the app's setup.
+    """
+
+    def __init__(
+        self,
+        shards: int,
+        journal_path: Optional[str] = None,
+        archive_dir: Optional[str] = None,
+        limits: Tuple[float, int] = (0, 0),
+        policy: str = "catch_up",
+        dtypes: Optional[AccountDtypes] = None,
+    ) -> None:
+        self.size: int = shards
+        self.journal_path: Optional[str] = journal_path
+        self.archive_dir: Optional[str] = archive_dir
+        self.limits: Tuple[float, int] = limits
+        self.policy: str = policy
+        self.dtypes: Optional[AccountDtypes] = dtypes
+        self.ring: HashRing = HashRing(shards)
+        self.shards: List[Shard] = []
+        self.lock: threading.Lock = threading.Lock()
+
+    def _shards(self) -> List[Shard]:
+        # Workers start on first use, so importing the registry never spawns processes
+        if not self.shards:
+            with self.lock:
+                if not self.shards:
+                    context = multiprocessing.get_context("spawn")
+                    self.shards = [
+                        Shard(
+                            context,
+                            i,
+                            self.journal_path,
+                            self.archive_dir,
+                            self.limits,
+                            self.policy,
+                            self.dtypes,
+                        )
+                        for i in range(self.size)
+                    ]
+        return self.shards
+
+    def shard_for(self, game_key: str) -> Shard:
+        return self._shards()[self.ring.shard_for(game_key)]
+
+    def __getitem__(self, game_key: str) -> RemoteEngine:
+        return RemoteEngine(self.shard_for(game_key), game_key)
+
+    def __setitem__(self, game_key: str, engine: GameEngine) -> None:
+        self.create(game_key, engine.exchange.market.epochs, engine.timestep, engine.seed)
+
+    def create(self, game_key: str, epochs: int, timestep: int, seed: Optional[int]) -> None:
+        """Build a waiting engine in the owning shard only, from its configuration."""
+        self.shard_for(game_key).call(game_key, "registry", "create", epochs, timestep, seed)
+
+    def __delitem__(self, game_key: str) -> None:
+        self.shard_for(game_key).call(game_key, "registry", "delete")
+
+    def __contains__(self, game_key: object) -> bool:
+        if not isinstance(game_key, str):
+            return False
+        return self.shard_for(game_key).call(game_key, "registry", "contains")
+
+    def __iter__(self) -> Iterator[str]:
+        for shard in self._shards():
+            yield from shard.call(None, "registry", "keys")
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def metrics(self) -> List[Dict[str, Any]]:
+        """Metrics recorded inside each worker process, such as tick timings."""
+        return [shard.call(None, "registry", "metrics") for shard in self._shards()]
+
+    def stats(self) -> Dict[str, Any]:
+        shards = [shard.call(None, "registry", "stats") for shard in self._shards()]
+        statuses: Dict[str, int] = {}
+        for shard in shards:
+            for status, count in shard["statuses"].items():
+                statuses[status] = statuses.get(status, 0) + count
+
+        return {
+            "games": sum(shard["games"] for shard in shards),
+            "statuses": statuses,
+            "memory_bytes": sum(shard["memory_bytes"] for shard in shards),
+            "memory_budget": self.limits[1],
+            "ttl": self.limits[0],
+            "evicted": sum(shard["evicted"] for shard in shards),
+            "shards": shards,
+        }
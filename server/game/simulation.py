@@ -0,0 +1,131 @@
+from typing import Callable, NamedTuple, Optional, Sequence
+
+import numpy as np
+
+from game.rng import spawn_generators
+
+Strategy = Callable[[int, np.ndarray, np.ndarray], np.ndarray]
+"""
+A vectorized player. Called once per epoch with the epoch, the log returns settled so far
+(markets x epoch+1) and the player's current leverage per market, it returns the position
+change to submit in every market.
+"""
+
+
+class SimulationResult(NamedTuple):
+    """Market series (markets x epochs+1) and position changes (markets x players x epochs+1)."""
+
+    log_return: np.ndarray
+    trading_volume: np.ndarray
+    order_flow: np.ndarray
+    jitter: np.ndarray
+    surge: np.ndarray
+    dispersion: np.ndarray
+    sentiment: np.ndarray
+    positions: np.ndarray
+
+
+def hold(epoch: int, log_return: np.ndarray, leverage: np.ndarray) -> np.ndarray:
+    """Never trade."""
+    return np.zeros(len(leverage), dtype=int)
+
+
+def momentum(epoch: int, log_return: np.ndarray, leverage: np.ndarray) -> np.ndarray:
+    """Buy after an up move and sell after a down move, one unit at a time."""
+    return np.sign(log_return[:, epoch]).astype(int)
+
+
+def simulate(
+    markets: int,
+    epochs: int,
+    strategies: Sequence[Strategy],
+    volatility: float = 0.01,
+    decay: float = 0.7,
+    seed: Optional[int] = None,
+) -> SimulationResult:
+    """
+    Run `markets` independent games to completion without a clock, following the same
+    trade-then-update sequence as GameEngine, Exchange.trade and Market.update_state.
+    """
+    players = len(strategies)
+    noise = np.stack([rng.standard_normal(epochs) for rng in spawn_generators(seed, markets)]).T
+
+    # Series are stored epoch-major so every per-epoch step works on contiguous rows
+    shape = (epochs + 1, markets)
+    log_return = np.zeros(shape, dtype=float)
+    trading_volume = np.zeros(shape, dtype=float)
+    order_flow = np.zeros(shape, dtype=float)
+    jitter = np.zeros(shape, dtype=float)
+    surge = np.zeros(shape, dtype=float)
+    dispersion = np.zeros(shape, dtype=float)
+    sentiment = np.zeros(shape, dtype=float)
+
+    positions = np.zeros((epochs + 1, players, markets), dtype=float)
+    leverage = np.zeros((players, markets), dtype=int)
+    nonzero_volumes = np.zeros(markets, dtype=int)
+    # Settled non-zero volumes, NaN elsewhere, so one masked percentile covers every market
+    volume_history = np.full(shape, np.nan)
+
+    for epoch in range(epochs):
+        # Players trade into the next epoch, subject to the exchange's leverage limit
+        for player, strategy in enumerate(strategies):
+            decision = strategy(epoch, log_return[: epoch + 1].T, leverage[player])
+            change = np.broadcast_to(np.asarray(decision, dtype=int), markets)
+            accepted = np.abs(leverage[player] + change) <= 10
+            positions[epoch + 1, player, accepted] = change[accepted]
+            leverage[player] += np.where(accepted, change, 0)
+
+        # Compute trading volume
+        buy_volume = positions[epoch].sum(axis=0)
+        sell_volume = -buy_volume
+
+        # calculate market metrics
+        volume = buy_volume + sell_volume
+        flow = buy_volume - sell_volume
+
+        # calculate percentile of trading volume, excluding the latest epoch
+        if epoch > 0:
+            settled = trading_volume[epoch - 1]
+            nonzero = settled != 0
+            nonzero_volumes += nonzero
+            volume_history[epoch - 1, nonzero] = settled[nonzero]
+        volume_percentile = np.full(markets, np.inf)
+        ready = nonzero_volumes >= 3
+        if ready.any():
+            volume_percentile[ready] = np.nanpercentile(volume_history[:epoch, ready], 90, axis=0)
+
+        # calculate market ratios
+        trading_volume_ratio = np.minimum(volume / volume_percentile, 1)
+        order_flow_ratio = np.clip(flow / volume_percentile, -1, 1)
+
+        # calculate short term market effects
+        epoch_jitter = volatility * (1 - trading_volume_ratio)
+        epoch_surge = 0.5 * volatility * order_flow_ratio
+
+        # calculate long term market effects
+        epoch_dispersion = dispersion[epoch] * decay + epoch_jitter * (1 - decay)
+        epoch_sentiment = sentiment[epoch] * decay + epoch_surge * (1 - decay)
+
+        # simulate price
+        mean, std = epoch_surge + epoch_sentiment, epoch_jitter + epoch_dispersion
+        epoch_log_return = mean + std * noise[epoch]
+
+        # Update market state
+        trading_volume[epoch + 1] = volume
+        order_flow[epoch + 1] = flow
+        jitter[epoch + 1] = epoch_jitter
+        surge[epoch + 1] = epoch_surge
+        dispersion[epoch + 1] = epoch_dispersion
+        sentiment[epoch + 1] = epoch_sentiment
+        log_return[epoch + 1] = epoch_log_return
+
+    return SimulationResult(
+        log_return.T,
+        trading_volume.T,
+        order_flow.T,
+        jitter.T,
+        surge.T,
+        dispersion.T,
+        sentiment.T,
+        positions.transpose(2, 1, 0),
+    )
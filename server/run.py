@@ -1,6 +1,9 @@
 from app import create_app
 
-app = create_app()
+# Also served as `flask --app run run` or `gunicorn run:app`. Spawned shard workers re-import
+# this script as __mp_main__, and must not build a second app there.
+if __name__ != "__mp_main__":
+    app = create_app()
 
 if __name__ == "__main__":
     app.run(use_reloader=False)
@@ -0,0 +1,76 @@
+import numpy as np
+
+from game.archive import OPEN_ARCHIVES, ArchivedGame, Archiver, open_matrix, write_archive
+from game.engine import GameEngine
+from game.registry import GameRegistry
+
+
+def finished_game() -> GameEngine:
+    engine = GameEngine(60, 1, seed=1)
+    engine.scheduler.remove(engine)
+    engine.start(["a", "b"])
+    engine.scheduler.remove(engine)
+    while engine.tick():
+        pass
+    return engine
+
+
+def test_archived_game_matches_engine(tmp_path) -> None:
+    engine = finished_game()
+    write_archive(str(tmp_path), "game", engine)
+    archived = ArchivedGame(str(tmp_path / "game"))
+
+    assert archived.exchange.get_latest_price() == engine.exchange.get_latest_price()
+    epoch, series = archived.exchange.get_scoreboard()
+    expected_epoch, expected = engine.exchange.get_scoreboard()
+    assert epoch == expected_epoch
+    for name, values in expected.items():
+        np.testing.assert_array_equal(series[name], values)
+
+
+def test_reading_many_archives_keeps_few_open(tmp_path) -> None:
+    engine = finished_game()
+    games = 2 * OPEN_ARCHIVES
+    for n in range(games):
+        write_archive(str(tmp_path), f"game{n}", engine)
+
+    registry = GameRegistry(ttl=1)
+    registry.update(Archiver(str(tmp_path)).load())
+    for game_key in registry:
+        registry[game_key].exchange.get_scoreboard()
+
+    assert open_matrix.cache_info().currsize <= OPEN_ARCHIVES
+
+
+def test_idle_archived_games_are_released_but_still_served(tmp_path) -> None:
+    write_archive(str(tmp_path), "game", finished_game())
+    registry = GameRegistry(ttl=1)
+    registry.update(Archiver(str(tmp_path)).load())
+    released: list[str] = []
+    registry.on_evict.append(released.append)
+
+    price = registry["game"].exchange.get_latest_price()
+    registry.last_access["game"] -= 2
+    assert registry.sweep() == []
+
+    assert released == ["game"]
+    assert "meta" not in registry.engines["game"].exchange.__dict__
+    assert registry["game"].exchange.get_latest_price() == price
+
+    # Not read since, so the next sweep leaves it alone
+    registry.sweep()
+    assert released == ["game"]
+
+
+def test_failed_archive_write_is_retried(tmp_path) -> None:
+    archiver = Archiver(str(tmp_path / "archive"))
+    games = GameRegistry()
+    games["game"] = finished_game()
+
+    (tmp_path / "archive").rmdir()
+    archiver.sweep(games)
+    assert isinstance(games["game"], GameEngine)
+
+    (tmp_path / "archive").mkdir()
+    archiver.sweep(games)
+    assert isinstance(games["game"], ArchivedGame)
@@ -0,0 +1,74 @@
+import numpy as np
+import pytest
+
+from game.exchange import Exchange
+from game.market import Market
+from game.quantile import ExactQuantile, P2Quantile
+from game.rng import spawn_generators
+from game.simulation import hold, momentum, simulate
+
+
+@pytest.mark.parametrize("q", [0.0, 0.1, 0.5, 0.9, 1.0])
+def test_exact_quantile_matches_numpy(q: float) -> None:
+    rng = np.random.default_rng(7)
+    # Rounded draws repeat, so ties are covered as well
+    values = np.round(rng.normal(size=500), 2)
+
+    estimator = ExactQuantile(q)
+    for n, value in enumerate(values, start=1):
+        estimator.add(float(value))
+        assert len(estimator) == n
+        assert estimator.value() == np.percentile(values[:n], 100 * q)
+
+
+def test_p2_quantile_approximates_numpy() -> None:
+    values = np.random.default_rng(11).exponential(size=5000)
+
+    estimator = P2Quantile(0.9)
+    for value in values:
+        estimator.add(float(value))
+
+    assert estimator.value() == pytest.approx(np.percentile(values, 90), rel=0.05)
+
+
+def test_market_volume_percentile_matches_previous_formula() -> None:
+    epochs, volatility = 300, 0.01
+    rng = np.random.default_rng(3)
+    market = Market(epochs, volatility=volatility, quantile="exact", rng=np.random.default_rng(4))
+    market.reference_players(rng.integers(-3, 4, size=(5, epochs + 1)))
+
+    for epoch in range(epochs):
+        # The percentile the market used before it kept a running quantile
+        current_tv = market.trading_volume[:epoch]
+        nonzero_tv = current_tv[current_tv != 0]
+        volume_percentile = np.percentile(nonzero_tv, 90) if nonzero_tv.size >= 3 else np.inf
+
+        market.update_state()
+
+        order_flow_ratio = np.clip(market.order_flow[epoch + 1] / volume_percentile, -1, 1)
+        assert market.surge[epoch + 1] == 0.5 * volatility * order_flow_ratio
+
+        # Buy and sell volume cancel in update_state, so a history with gaps is written in
+        if rng.random() < 0.7:
+            market.trading_volume[epoch + 1] = rng.exponential(10)
+
+    assert len(market.volume_quantile) > 150
+
+
+@pytest.mark.parametrize("strategy", [hold, momentum])
+def test_seeded_price_path_matches_simulation(strategy) -> None:
+    # Checks the noise stream and update order; volumes always cancel, so the percentile is
+    # covered by the test above
+    epochs, seed = 200, 1234
+    expected = simulate(1, epochs, [strategy], seed=seed)
+
+    exchange = Exchange(Market(epochs, rng=spawn_generators(seed, 1)[0]))
+    exchange.add_player_account("player")
+    for epoch in range(epochs):
+        log_return = exchange.market.log_return[np.newaxis, : epoch + 1]
+        leverage = exchange.leverage[np.newaxis, 0]
+        exchange.trade("player", int(strategy(epoch, log_return, leverage)[0]))
+        exchange.update_market()
+
+    np.testing.assert_array_equal(exchange.market.log_return, expected.log_return[0])
+    np.testing.assert_array_equal(exchange.market.trading_volume, expected.trading_volume[0])
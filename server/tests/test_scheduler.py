@@ -0,0 +1,99 @@
+import pytest
+
+from game.clock import VirtualClock
+from game.metrics import metrics
+from game.scheduler import TickScheduler
+
+
+class Ticker:
+    """A stand-in engine that records when it ticks and takes `duration` seconds to do so."""
+
+    def __init__(self, clock: VirtualClock, epochs: int, timestep: int = 1, duration: float = 0.0):
+        self.clock = clock
+        self.epochs = epochs
+        self.timestep = timestep
+        self.duration = duration
+        self.ticked_at: list[float] = []
+
+    def tick(self) -> bool:
+        self.ticked_at.append(self.clock.now())
+        self.clock.advance(self.duration)
+        return len(self.ticked_at) < self.epochs
+
+
+def run_until_idle(scheduler: TickScheduler) -> int:
+    ticks = 0
+    while count := scheduler.run_pending():
+        ticks += count
+    return ticks
+
+
+@pytest.fixture(autouse=True)
+def reset_metrics():
+    metrics.reset()
+    yield
+    metrics.reset()
+
+
+def test_slow_ticks_do_not_push_back_deadlines() -> None:
+    clock = VirtualClock()
+    scheduler = TickScheduler(clock, background=False)
+    engine = Ticker(clock, epochs=10, duration=0.4)
+    scheduler.add(engine)
+
+    assert scheduler.run_pending() == 0
+    for deadline in range(1, 6):
+        clock.advance(deadline - clock.now())
+        assert scheduler.run_pending() == 1
+
+    assert engine.ticked_at == [1, 2, 3, 4, 5]
+    assert "tick.caught_up" not in metrics.counters
+
+
+def test_catch_up_ticks_overdue_epochs_back_to_back() -> None:
+    clock = VirtualClock()
+    scheduler = TickScheduler(clock, policy="catch_up", background=False)
+    engine = Ticker(clock, epochs=10)
+    scheduler.add(engine)
+
+    clock.advance(3.5)
+    assert run_until_idle(scheduler) == 3
+    assert metrics.counters["tick.caught_up"] == 2
+
+    clock.advance(0.5)
+    assert run_until_idle(scheduler) == 1
+    assert len(engine.ticked_at) == 4
+
+
+def test_skip_drops_overdue_epochs() -> None:
+    clock = VirtualClock()
+    scheduler = TickScheduler(clock, policy="skip", background=False)
+    engine = Ticker(clock, epochs=10)
+    scheduler.add(engine)
+
+    clock.advance(3.5)
+    assert run_until_idle(scheduler) == 1
+    assert metrics.counters["tick.missed"] == 2
+
+    clock.advance(0.5)
+    assert run_until_idle(scheduler) == 1
+    assert engine.ticked_at == [3.5, 4]
+
+
+def test_finished_and_removed_engines_stop_ticking() -> None:
+    clock = VirtualClock()
+    scheduler = TickScheduler(clock, background=False)
+    finished, removed = Ticker(clock, epochs=2), Ticker(clock, epochs=10)
+    scheduler.add(finished)
+    scheduler.add(removed)
+
+    clock.advance(1)
+    assert scheduler.run_pending() == 2
+    scheduler.remove(removed)
+
+    clock.advance(5)
+    assert run_until_idle(scheduler) == 1
+    assert not scheduler.is_scheduled(finished)
+    assert not scheduler.is_scheduled(removed)
+    assert len(finished.ticked_at) == 2
+    assert len(removed.ticked_at) == 1